@@ -6,7 +6,10 @@ from PySide6.QtCore import QThread, Signal
 from lib.daq import DAQ
 from lib.daq.ni_device import NIDevice
 from lib.daq.ni_device.channel_initializers import VibChannelInitializer, TempChannelInitializer
+from lib.lstm_ae import InferenceExecutor
+from lib.file_mover import FileMover
 
+from config.paths import MODEL_DIR
 from config import NIDeviceConfig, NIDeviceType, DAQSystemConfig, MachineConfig
 from .data_saver import DataSaver
 from .data_sender import DataSender
@@ -23,7 +26,12 @@ class DAQSystem(QThread):
 
         # 센서 타입 매핑과 장비/머신 인스턴스 구성
         self.sensor_types: Dict[str, NIDeviceType] = {}
+        self.sensor_rates: Dict[str, int] = {}
         self._ni_devices: List[NIDevice] = [self.create_ni_device(ni_conf) for ni_conf in self._conf.NI_DEVICES]
+        self._inference_executor: InferenceExecutor = self.create_inference_executor()
+        self._data_savers: List[DataSaver] = []
+        # 모든 머신이 공유하는 외부 경로 파일 이동 작업자
+        self._file_mover: FileMover = FileMover(max_rate=self._conf.FILE_MOVE_RATE * 2 ** 20)
         self._machines: List[Machine] = [self.create_machine(m_conf) for m_conf in self._conf.MACHINES]
 
         self._daq: DAQ = DAQ(ni_devices=self._ni_devices)
@@ -45,39 +53,58 @@ class DAQSystem(QThread):
         # NI-DAQ 장치 생성 및 센서 등록
         ni_device = NIDevice(name=d_conf.NAME,
                              rate=d_conf.RATE,
-                             channel_initializer=channel_initializer)
+                             channel_initializer=channel_initializer,
+                             chunk_duration=d_conf.CHUNK_DURATION)
 
         for s_conf in d_conf.SENSORS:
             self.sensor_types[s_conf.NAME] = d_conf.TYPE
+            self.sensor_rates[s_conf.NAME] = d_conf.RATE
             ni_device.add_sensor(sensor_name=s_conf.NAME,
                                  channel=s_conf.CHANNEL,
                                  options=s_conf.OPTIONS)
 
         return ni_device
 
+    def create_inference_executor(self) -> InferenceExecutor:
+        # 이상 탐지 머신이 있을 때만 추론 프로세스 풀 생성 (모든 머신이 공유)
+        machines = [m_conf.NAME for m_conf in self._conf.MACHINES if m_conf.FAULT_DETECTABLE]
+        if not machines:
+            return None
+        return InferenceExecutor(model_dir=MODEL_DIR,
+                                 machines=machines,
+                                 workers=self._conf.INFERENCE_WORKERS,
+                                 max_queue=self._conf.INFERENCE_QUEUE)
+
     def create_machine(self, m_conf: MachineConfig) -> Machine:
         machine = Machine(name=m_conf.NAME,
                           sensors=m_conf.SENSORS,
                           fault_detectable=m_conf.FAULT_DETECTABLE,
-                          fault_threshold=m_conf.FAULT_THRESHOLD)
+                          fault_threshold=m_conf.FAULT_THRESHOLD,
+                          inference_executor=self._inference_executor)
 
         # 데이터 전송/저장 모드에 따라 핸들러 등록
         send_conf = m_conf.DATA_SEND_MODE
         if send_conf.ACTIVATION:
             cur_sensor_types = {sensor: s_type for sensor, s_type in self.sensor_types.items() if sensor in m_conf.SENSORS}
+            cur_sensor_rates = {sensor: rate for sensor, rate in self.sensor_rates.items() if sensor in m_conf.SENSORS}
             data_sender = DataSender(name=m_conf.NAME,
                                      host=send_conf.HOST,
                                      port=send_conf.PORT,
                                      timeout=send_conf.TIMEOUT,
-                                     sensor_types=cur_sensor_types)
+                                     sensor_types=cur_sensor_types,
+                                     sensor_rates=cur_sensor_rates)
             machine.register_handler(data_sender)
 
         save_conf = m_conf.DATA_SAVE_MODE
         if save_conf.ACTIVATION:
             data_saver = DataSaver(name=m_conf.NAME,
                                    sensors=m_conf.SENSORS,
-                                   external_path=save_conf.PATH)
+                                   external_path=save_conf.PATH,
+                                   save_format=save_conf.FORMAT,
+                                   compress=save_conf.COMPRESS,
+                                   file_mover=self._file_mover)
             machine.register_handler(data_saver)
+            self._data_savers.append(data_saver)
 
         return machine
 
@@ -98,6 +125,12 @@ class DAQSystem(QThread):
 
     def stop(self):
         # 스레드 종료 플래그 설정 및 정리
+        self._daq.read_stop()
+        for data_saver in self._data_savers:
+            data_saver.close()
+        self._file_mover.stop()
+        if self._inference_executor is not None:
+            self._inference_executor.shutdown()
         self._event.set()
         self.quit()
         self.wait(3000)
@@ -115,7 +148,7 @@ class EventSender(EventHandler):
         self._machine = machine
         self._machine.register_handler(self)
 
-    async def event_handle(self, event: MachineEvent, data: Dict) -> None:
-        # GUI 스레드로 이벤트 전달
+    async def event_handle(self, event: MachineEvent, data: any) -> None:
+        # GUI 스레드로 이벤트 전달 (DataChunk 배열은 이후 수정되지 않으므로 그대로 공유)
         zipped_data = (event, data)
         self._signal.emit(zipped_data)
@@ -1,10 +1,14 @@
 import os
-import shutil
-from typing import List, Dict
+import time
+from typing import List, Dict, Union
 
 from util.clock import get_date, get_time, TimeEvent
 from config.paths import DATA_DIR
+from config import DataSaveFormat
 from lib.csv_writer import CsvWriter
+from lib.raw_store import RawWriter
+from lib.file_mover import FileMover
+from lib.daq import DataChunk
 from .machine import EventHandler
 from .machine.machine_event import MachineEvent
 
@@ -13,45 +17,71 @@ class DataSaver(EventHandler):
     def __init__(self,
                  name: str,
                  sensors: List[str],
-                 external_path: str):
+                 external_path: str,
+                 save_format: DataSaveFormat = DataSaveFormat.CSV,
+                 compress: bool = False,
+                 file_mover: FileMover = None):
         self._save_path = os.path.join(DATA_DIR, name)
         self._sensors = sensors
         self._external_path = os.path.join(external_path, name)
+        self._format = save_format
+        self._compress = compress
+        # 파일 이동은 백그라운드 작업자에 맡김 (미지정 시 자체 작업자 사용)
+        self._own_mover = file_mover is None
+        self._file_mover = file_mover if file_mover is not None else FileMover()
 
-        self._writers: Dict[str, CsvWriter] = {}
+        self._writers: Dict[str, Union[CsvWriter, RawWriter]] = {}
         self._time_event = TimeEvent()
+        os.makedirs(self._external_path, exist_ok=True)
         self._init_writers()
 
     def _init_writers(self):
-        self._writers = {}
-
-        # 날짜별 CSV 파일 생성
+        # 날짜별 CSV/RAW 파일 생성 (기존 작성기는 새 파일로 롤오버)
         os.makedirs(self._save_path, exist_ok=True)
-        os.makedirs(self._external_path, exist_ok=True)
         for sensor in self._sensors:
-            header: List[str] = ['time', 'data']
-            path = os.path.join(self._save_path, f'{get_date()}_{sensor}.csv')
-            self._writers[sensor] = CsvWriter(path, header)
+            extension = 'raw' if self._format is DataSaveFormat.RAW else 'csv'
+            path = os.path.join(self._save_path, f'{get_date()}_{sensor}.{extension}')
+            if sensor in self._writers:
+                self._writers[sensor].rollover(path)
+            elif self._format is DataSaveFormat.RAW:
+                self._writers[sensor] = RawWriter(path, compress=self._compress)
+            else:
+                header: List[str] = ['time', 'data']
+                self._writers[sensor] = CsvWriter(path, header)
 
     def _move_files(self):
-        # 하루가 바뀌면 기존 CSV를 외부 경로로 이동
+        # 하루가 바뀌면 기록 중이 아닌 기존 파일을 외부 경로 이동 작업으로 넘김 (이벤트 루프는 기다리지 않음)
         files = os.listdir(self._save_path)
+        opened = {os.path.basename(writer.path()) for writer in self._writers.values()}
 
-        os.makedirs(self._external_path, exist_ok=True)
         for file_name in files:
+            if file_name in opened:
+                continue
             src_path = os.path.join(self._save_path, file_name)
             dest_path = os.path.join(self._external_path, file_name)
-            shutil.move(src_path, dest_path)
+            self._file_mover.submit(src_path, dest_path)
 
-    async def event_handle(self, event: MachineEvent, data: Dict) -> None:
+    def close(self) -> None:
+        for writer in self._writers.values():
+            writer.close()
+        if self._own_mover:
+            self._file_mover.stop()
+
+    async def event_handle(self, event: MachineEvent, data: DataChunk) -> None:
         if event is MachineEvent.DataUpdate:
-            # 날짜 변경 시 파일 롤오버
+            # 날짜 변경 시 새 파일로 롤오버 후 닫힌 파일 이동
             if self._time_event.is_day_change():
-                self._move_files()
                 self._init_writers()
+                self._move_files()
+
+            if self._format is DataSaveFormat.RAW:
+                # 수신 시각을 마지막 샘플 시각으로 보고 청크 시작 시각 계산
+                start_ns = time.time_ns() - len(data) * 1_000_000_000 // data.rate
+                for sensor, datas in data.items():
+                    self._writers[sensor].add_chunk(datas, data.rate, start_ns)
+                return
 
             cur_time = get_time()
             for sensor, datas in data.items():
-                # 시간 + 데이터 형태로 저장
-                datas = [[cur_time, data] for data in datas]
-                self._writers[sensor].add_datas(datas)
+                # 시간 + 데이터 형태로 청크 단위 저장
+                self._writers[sensor].add_block(cur_time, datas)
@@ -1,8 +1,8 @@
 import asyncio
 from typing import Dict
-from scipy import signal
 
 from config import NIDeviceType
+from lib.resample import Resampler, PolyphaseResampler, BlockAverageDecimator
 from .machine_client import MachineClient
 from .machine import EventHandler
 from .machine.machine_event import MachineEvent
@@ -16,12 +16,21 @@ class DataSender(EventHandler):
                  host: str,
                  port: int,
                  timeout: int,
-                 sensor_types: Dict[str, NIDeviceType]):
+                 sensor_types: Dict[str, NIDeviceType],
+                 sensor_rates: Dict[str, int]):
         self.name = name
         self.host = host
         self.port = port
         self.timeout = timeout
         self.sensor_types = sensor_types
+        # 전송 데이터의 샘플링 레이트 (리샘플링 센서는 MAXIMUM_RATE)
+        self.send_rates: Dict[str, int] = {sensor: min(rate, MAXIMUM_RATE) for sensor, rate in sensor_rates.items()}
+
+        # 전송량을 줄이기 위해 센서별로 MAXIMUM_RATE 로 다운샘플링 (청크 간 상태 유지)
+        self.resamplers: Dict[str, Resampler] = {
+            sensor: self.create_resampler(self.sensor_types[sensor], rate)
+            for sensor, rate in sensor_rates.items() if MAXIMUM_RATE < rate
+        }
 
         self.transport = None
         self.protocol = None
@@ -43,7 +52,7 @@ class DataSender(EventHandler):
             except Exception:
                 await asyncio.sleep(self.timeout)
 
-    async def event_handle(self, event: MachineEvent, data: Dict) -> None:
+    async def event_handle(self, event: MachineEvent, data: any) -> None:
         # 서버 연결이 있을 때만 데이터 전송
         if not self.is_closing():
             event, data = self.convert(event, data)
@@ -52,13 +61,21 @@ class DataSender(EventHandler):
     def is_closing(self) -> bool:
         return self.protocol is None or self.protocol.is_closing()
 
-    def convert(self, event: MachineEvent, data: Dict):
+    @staticmethod
+    def create_resampler(sensor_type: NIDeviceType, rate: int) -> Resampler:
+        # 느린 온도 신호는 구간 평균, 진동 신호는 안티에일리어싱 폴리페이즈 필터
+        if sensor_type == NIDeviceType.TEMP:
+            return BlockAverageDecimator(rate, MAXIMUM_RATE)
+        return PolyphaseResampler(rate, MAXIMUM_RATE)
+
+    def convert(self, event: MachineEvent, data: any):
         if event is MachineEvent.DataUpdate:
-            # 전송량을 줄이기 위해 일정 길이로 리샘플링
+            # 전송량을 줄이기 위해 MAXIMUM_RATE 로 리샘플링 (직렬화 형식은 MachineClient 가 결정)
             data = {
                 sensor: {
                     'type': self.sensor_types[sensor].name,
-                    'data': signal.resample(s_data, MAXIMUM_RATE).tolist() if MAXIMUM_RATE < len(s_data) else s_data
+                    'rate': self.send_rates[sensor],
+                    'data': self.resamplers[sensor].process(s_data) if sensor in self.resamplers else s_data
                 } for sensor, s_data in data.items()
             }
         elif event is MachineEvent.FaultDetect:
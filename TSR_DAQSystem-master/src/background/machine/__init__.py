@@ -1,3 +1,4 @@
 from .machine import Machine
 from .event_handler import EventHandler
 from .machine_event import MachineEvent
+from .batch_accumulator import BatchAccumulator
@@ -0,0 +1,42 @@
+import numpy as np
+from typing import Iterator
+
+
+class BatchAccumulator:
+    """
+        센서 하나의 이상 탐지 배치를 모으는 고정 크기 누적 버퍼
+        미리 할당한 배열에 커서 위치부터 샘플을 채우고, 가득 차면 배치 뷰를 내보낸다.
+        배치 경계를 넘는 샘플은 버리지 않고 다음 배치로 이어지며,
+        hop 이 batch_size 보다 작으면 마지막 (batch_size - hop) 샘플을 겹쳐 슬라이딩 배치를 만든다.
+    """
+    def __init__(self, batch_size: int, hop: int = 0, dtype=np.float64):
+        self._batch_size: int = batch_size
+        # hop 미지정(0) 시 겹침 없이 batch_size 단위로 진행
+        self._hop: int = hop if 0 < hop <= batch_size else batch_size
+        self._buffer: np.ndarray = np.empty(batch_size, dtype=dtype)
+        self._cursor: int = 0
+
+    def __len__(self) -> int:
+        return self._cursor
+
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    def push(self, data: np.ndarray) -> Iterator[np.ndarray]:
+        # 채워진 배치를 차례로 반환 (뷰는 다음 반복 전까지만 유효하므로 보관 시 복사)
+        offset = 0
+        while offset < len(data):
+            count = min(self._batch_size - self._cursor, len(data) - offset)
+            self._buffer[self._cursor:self._cursor + count] = data[offset:offset + count]
+            self._cursor += count
+            offset += count
+
+            if self._cursor == self._batch_size:
+                yield self._buffer
+                # 겹치는 구간만 앞으로 옮기고 이어서 채움
+                keep = self._batch_size - self._hop
+                self._buffer[:keep] = self._buffer[self._hop:]
+                self._cursor = keep
+
+    def clear(self) -> None:
+        self._cursor = 0
@@ -1,4 +1,3 @@
-from typing import Dict
 from abc import ABC, abstractmethod
 
 from .machine_event import MachineEvent
@@ -6,5 +5,6 @@ from .machine_event import MachineEvent
 
 class EventHandler(ABC):
     @abstractmethod
-    async def event_handle(self, event: MachineEvent, data: Dict) -> None:
+    async def event_handle(self, event: MachineEvent, data: any) -> None:
+        # DataUpdate: DataChunk, FaultDetect: {'score', 'threshold'}
         pass
@@ -1,14 +1,18 @@
-import yaml
 import asyncio
+import numpy as np
 
-from typing import Dict, List
-from pandas import DataFrame
+from collections import deque
+from typing import Deque, Dict, List
 
-from lib.daq import DataHandler
-from lib.lstm_ae import LstmAE, ModelConfig
+from lib.daq import DataHandler, DataChunk
+from lib.lstm_ae import ModelConfig, InferenceExecutor, load_model_configs
 from config.paths import MODEL_DIR
 from .machine_event import MachineEvent
 from .event_handler import EventHandler
+from .batch_accumulator import BatchAccumulator
+
+# 센서별로 대기시킬 수 있는 완성 배치 수 (다른 센서가 늦을 때 메모리 상한)
+READY_BATCHES: int = 2
 
 
 class Machine(DataHandler):
@@ -16,21 +20,27 @@ class Machine(DataHandler):
                  name: str,
                  sensors: List[str],
                  fault_detectable: bool = False,
-                 fault_threshold: int = 0):
+                 fault_threshold: int = 0,
+                 inference_executor: InferenceExecutor = None):
         self._name: str = name
         self._sensors: List[str] = sensors
         self._fault_detectable: bool = fault_detectable
         self._fault_threshold: int = fault_threshold
+        self._inference_executor: InferenceExecutor = inference_executor
 
         self._loop = asyncio.get_event_loop()
         self._event_handlers: List[EventHandler] = []
 
-        # 이상 탐지 모드일 경우 모델과 배치 버퍼 초기화
+        # 이상 탐지 모드일 경우 모델 구성과 배치 버퍼 초기화 (모델은 추론 워커에서 로드)
+        if self._fault_detectable and self._inference_executor is None:
+            self._fault_detectable = False
         if self._fault_detectable:
-            self._models: Dict[str, LstmAE] = {}
-            self._batches: Dict[str, List] = {}
+            self._models: Dict[str, ModelConfig] = {}
+            self._batches: Dict[str, BatchAccumulator] = {}
+            self._ready: Dict[str, Deque[np.ndarray]] = {}
             self._init_models()
-            self._init_batches()
+            if self._fault_detectable:
+                self._init_batches()
 
     def get_name(self) -> str:
         return self._name
@@ -43,25 +53,18 @@ class Machine(DataHandler):
 
     def _init_models(self) -> None:
         try:
-            # 머신별 METADATA.yml에서 모델 구성 로드
-            with open(f'{MODEL_DIR}\\{self._name}\\METADATA.yml', 'r', encoding='UTF-8') as yml:
-                cfg = yaml.safe_load(yml)
-
-            for conf in [ModelConfig(**parm) for parm in cfg['MODELS']]:
-                model = LstmAE(seq_len=conf.SEQ_LEN,
-                               input_dim=1,
-                               latent_dim=conf.LATENT_DIM,
-                               batch_size=conf.BATCH_SIZE,
-                               threshold=conf.THRESHOLD)
-                model.load(f'{MODEL_DIR}\\{self._name}\\{conf.NAME}.h5')
-                self._models[conf.NAME] = model
+            # 배치 크기 결정을 위해 모델 구성만 읽음
+            for conf in load_model_configs(MODEL_DIR, self._name):
+                self._models[conf.NAME] = conf
         except Exception as err:
-            # 모델 로드 실패 시 이상 탐지 비활성화
+            # 모델 구성 로드 실패 시 이상 탐지 비활성화
             self._fault_detectable = False
             print(err)
 
     def _init_batches(self) -> None:
-        self._batches = {name: [] for name in sorted(self._sensors)}
+        self._batches = {name: BatchAccumulator(self._models[name].BATCH_SIZE, self._models[name].HOP)
+                         for name in self._sensors}
+        self._ready = {name: deque(maxlen=READY_BATCHES) for name in self._sensors}
 
     def register_handler(self, event_handler: EventHandler) -> None:
         self._event_handlers.append(event_handler)
@@ -70,37 +73,39 @@ class Machine(DataHandler):
         if event_handler in self._event_handlers:
             self._event_handlers.remove(event_handler)
 
-    async def data_update(self, device_name: str, named_datas: Dict[str, List[float]]) -> None:
-        named_datas = {sensor: data for sensor, data in named_datas.items() if sensor in self._sensors}
+    async def data_update(self, device_name: str, chunk: DataChunk) -> None:
+        # 이 머신의 센서 행만 슬라이싱 (연속된 행이면 복사 없음)
+        chunk = chunk.select(self._sensors)
 
-        if len(named_datas):
+        if len(chunk.channel_index):
             # 실시간 업데이트 이벤트 전달
-            await self._event_notify(MachineEvent.DataUpdate, named_datas)
+            await self._event_notify(MachineEvent.DataUpdate, chunk)
             if self._fault_detectable:
-                await self._fault_detect(named_datas)
-
-    async def _fault_detect(self, named_datas: Dict[str, List[float]]) -> None:
-        # 센서별 배치가 채워지면 모델 추론 수행
-        is_batch = len(named_datas) != 0
-        for name, data in named_datas.items():
-            if len(self._batches[name]) < self._models[name].batch_size:
-                self._batches[name] += data
-                is_batch = False
-
-        if is_batch:
-            score = 0
-            for name in self._sensors:
-                target = DataFrame()
-                target['data'] = self._batches[name][:self._models[name].batch_size]
-                score += self._models[name].detect(target)
-            self._init_batches()
-
-            await self._event_notify(MachineEvent.FaultDetect, {
-                'score': score,
-                'threshold': self._fault_threshold
-            })
-
-    async def _event_notify(self, event: MachineEvent, data: Dict) -> None:
+                await self._fault_detect(chunk)
+
+    async def _fault_detect(self, chunk: DataChunk) -> None:
+        # 센서별 누적 버퍼에 채우고, 완성된 배치는 복사해 대기 (경계를 넘는 샘플은 다음 배치로 이어짐)
+        for name, data in chunk.items():
+            for batch in self._batches[name].push(data):
+                self._ready[name].append(batch.copy())
+
+        # 모든 센서의 배치가 준비되면 추론 실행기에 제출 (수집 루프는 결과를 기다리지 않음)
+        while all(self._ready[name] for name in self._sensors):
+            batches = {name: self._ready[name].popleft() for name in self._sensors}
+            self._loop.create_task(self._inference(batches))
+
+    async def _inference(self, batches: Dict[str, np.ndarray]) -> None:
+        score = await self._inference_executor.submit(self._name, batches)
+        # 추론이 밀려 버려졌거나 실패한 배치는 알리지 않음
+        if score is None:
+            return
+
+        await self._event_notify(MachineEvent.FaultDetect, {
+            'score': score,
+            'threshold': self._fault_threshold
+        })
+
+    async def _event_notify(self, event: MachineEvent, data: any) -> None:
         for handler in self._event_handlers:
             try:
                 self._loop.create_task(handler.event_handle(event, data))
@@ -4,6 +4,8 @@ import asyncio
 import socket
 from asyncio import Protocol, Event, transports
 
+from . import wire_protocol
+
 SEP         : bytes = b'\o'
 SEP_LEN     : int = len(SEP)
 
@@ -17,6 +19,10 @@ class MachineClient(Protocol):
         self._writer = None
         self._reader = None
 
+        # 서버가 바이너리 프로토콜을 수락하면 부여받은 번호 (None 이면 기존 pickle 전송)
+        self.machine_id = None
+        self._recv_buffer = bytearray()
+
     def connection_made(self, transport: transports.WriteTransport) -> None:
         self._transport = transport
         # TCP KeepAlive 설정 (서버가 끊겼는지 감지)
@@ -30,11 +36,39 @@ class MachineClient(Protocol):
                                             protocol=self,
                                             reader=self._reader,
                                             loop=asyncio.get_event_loop())
-        # 최초 핸드셰이크: 머신 이름 전송
-        self.send_data(event='name', data=self.name)
+        # 최초 핸드셰이크: 머신 이름 전송 후 바이너리 프로토콜 요청 (기존 서버는 무시)
+        self._send_legacy(event='name', data=self.name)
+        self._send_legacy(event='protocol', data=wire_protocol.VERSION)
         print(f'{self.name} connection made')
 
+    def data_received(self, data: bytes) -> None:
+        # 서버의 ProtocolAck 수신 시 바이너리 전송으로 전환
+        try:
+            self._recv_buffer += data
+            machine_id = wire_protocol.parse_ack(self._recv_buffer)
+            if machine_id is not None:
+                self.machine_id = machine_id
+                print(f'{self.name} binary protocol v{wire_protocol.VERSION} accepted (id {machine_id})')
+        except RuntimeError:
+            self._recv_buffer.clear()
+
     def send_data(self, event, data) -> None:
+        if self.machine_id is not None and event in wire_protocol.EVENT_IDS:
+            try:
+                self._writer.write(wire_protocol.encode(event, self.machine_id, data))
+            except Exception:
+                raise RuntimeError('serialize error')
+        else:
+            self._send_legacy(event, self._to_legacy(event, data))
+
+    @staticmethod
+    def _to_legacy(event, data):
+        # 기존 서버 형식: 샘플은 리스트, rate 항목 없음
+        if event == 'DataUpdate':
+            return {sensor: {'type': s_data['type'], 'data': s_data['data'].tolist()} for sensor, s_data in data.items()}
+        return data
+
+    def _send_legacy(self, event, data) -> None:
         try:
             # pickle 직렬화 후 SEP로 메시지 경계 표시
             with io.BytesIO() as memfile:
@@ -0,0 +1,113 @@
+"""
+    DAQ → 모니터링 서버 바이너리 프레임 프로토콜 (버전 1)
+
+    프레임 : [헤더 12 bytes][페이로드]
+      헤더 '<4sBBHI' : magic(b'TSRW') version event_id machine_id payload_len
+    DataUpdate 페이로드 : sensor_count(H) + 센서마다
+      '<BBII' name_len type_id rate count + 이름(UTF-8) + float32 LE 샘플 count 개
+    FaultDetect 페이로드 : '<dd' score threshold
+    ProtocolAck (서버 → DAQ) : 페이로드 없음, 헤더의 machine_id 가 서버가 부여한 번호
+
+    협상 : 기존 pickle 로 ('name', <machine_name>) 전송 후 ('protocol', VERSION) 전송,
+    서버가 ProtocolAck 를 보내면 이후 프레임을 바이너리로 전송 (응답이 없으면 기존 pickle 유지)
+"""
+import struct
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+MAGIC: bytes = b'TSRW'
+VERSION: int = 1
+
+HEADER = struct.Struct('<4sBBHI')
+SENSOR_COUNT = struct.Struct('<H')
+SENSOR_HEADER = struct.Struct('<BBII')
+FAULT_DETECT = struct.Struct('<dd')
+SAMPLE_DTYPE = np.dtype('<f4')
+
+EVENT_DATA_UPDATE: int = 1
+EVENT_FAULT_DETECT: int = 2
+EVENT_PROTOCOL_ACK: int = 3
+
+EVENT_NAMES: Dict[int, str] = {EVENT_DATA_UPDATE: 'DataUpdate', EVENT_FAULT_DETECT: 'FaultDetect'}
+EVENT_IDS: Dict[str, int] = {name: event_id for event_id, name in EVENT_NAMES.items()}
+
+# 센서 타입 번호 (NIDeviceType 과 같은 순서)
+SENSOR_TYPES: Tuple[str, ...] = ('VIB', 'TEMP')
+
+
+def encode_header(event_id: int, machine_id: int, payload_len: int) -> bytes:
+    return HEADER.pack(MAGIC, VERSION, event_id, machine_id, payload_len)
+
+
+def encode_data_update(machine_id: int, data: Dict[str, Dict[str, any]]) -> bytes:
+    # data : {sensor: {'type': 'VIB', 'rate': int, 'data': np.ndarray}}
+    parts = [SENSOR_COUNT.pack(len(data))]
+    for sensor, s_data in data.items():
+        name = sensor.encode('utf-8')
+        samples = np.ascontiguousarray(s_data['data'], dtype=SAMPLE_DTYPE)
+        parts.append(SENSOR_HEADER.pack(len(name), SENSOR_TYPES.index(s_data['type']) + 1, s_data['rate'], len(samples)))
+        parts.append(name)
+        parts.append(samples.tobytes())
+    payload = b''.join(parts)
+    return encode_header(EVENT_DATA_UPDATE, machine_id, len(payload)) + payload
+
+
+def encode_fault_detect(machine_id: int, data: Dict[str, any]) -> bytes:
+    payload = FAULT_DETECT.pack(data['score'], data['threshold'])
+    return encode_header(EVENT_FAULT_DETECT, machine_id, len(payload)) + payload
+
+
+def encode(event_name: str, machine_id: int, data: any) -> bytes:
+    if event_name == 'DataUpdate':
+        return encode_data_update(machine_id, data)
+    if event_name == 'FaultDetect':
+        return encode_fault_detect(machine_id, data)
+    raise RuntimeError('unsupported wire event')
+
+
+def decode_header(header: bytes) -> Tuple[int, int, int]:
+    magic, version, event_id, machine_id, payload_len = HEADER.unpack(header)
+    if magic != MAGIC or version != VERSION:
+        raise RuntimeError('invalid frame header')
+    return event_id, machine_id, payload_len
+
+
+def decode_payload(event_id: int, payload: bytes) -> Tuple[str, any]:
+    # 기존 pickle 메시지와 같은 (event, data) 형태로 복원, 샘플은 float32 배열 뷰
+    if event_id == EVENT_DATA_UPDATE:
+        data = {}
+        (count,) = SENSOR_COUNT.unpack_from(payload, 0)
+        offset = SENSOR_COUNT.size
+        for _ in range(count):
+            name_len, type_id, rate, samples = SENSOR_HEADER.unpack_from(payload, offset)
+            offset += SENSOR_HEADER.size
+            name = bytes(payload[offset:offset + name_len]).decode('utf-8')
+            offset += name_len
+            data[name] = {
+                'type': SENSOR_TYPES[type_id - 1],
+                'rate': rate,
+                'data': np.frombuffer(payload, dtype=SAMPLE_DTYPE, count=samples, offset=offset)
+            }
+            offset += samples * SAMPLE_DTYPE.itemsize
+        return EVENT_NAMES[event_id], data
+    if event_id == EVENT_FAULT_DETECT:
+        score, threshold = FAULT_DETECT.unpack(payload)
+        return EVENT_NAMES[event_id], {'score': _number(score), 'threshold': _number(threshold)}
+    raise RuntimeError('unsupported wire event')
+
+
+def _number(value: float):
+    # 정수로 보낸 점수/임계값은 정수로 복원
+    return int(value) if value.is_integer() else value
+
+
+def parse_ack(buffer: bytearray) -> Optional[int]:
+    # 수신 버퍼에서 ProtocolAck 프레임을 꺼내 서버가 부여한 machine_id 반환 (없으면 None)
+    while len(buffer) >= HEADER.size:
+        event_id, machine_id, payload_len = decode_header(bytes(buffer[:HEADER.size]))
+        if len(buffer) < HEADER.size + payload_len:
+            return None
+        del buffer[:HEADER.size + payload_len]
+        if event_id == EVENT_PROTOCOL_ACK:
+            return machine_id
+    return None
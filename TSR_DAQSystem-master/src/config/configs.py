@@ -22,6 +22,8 @@ class NIDeviceConfig:
     TYPE        : NIDeviceType
     RATE        : int
     SENSORS     : List[SensorConfig]
+    # 읽기 주기 (초), 실시간 차트 지연을 줄이려면 0.1 등으로 설정
+    CHUNK_DURATION  : float = 1.0
 
     def __post_init__(self):
         if isinstance(self.SENSORS, Dict):
@@ -53,9 +55,22 @@ class DataSendModeConfig(ActivableModeConfig):
         pass
 
 
+class DataSaveFormat(Enum):
+    CSV: int = auto()
+    RAW: int = auto()
+
+
 @dataclass
 class DataSaveModeConfig(ActivableModeConfig):
     PATH            : str = ''
+    # 저장 형식 (CSV: time,data 텍스트, RAW: float32 바이너리 청크) 과 RAW 압축 여부
+    FORMAT          : DataSaveFormat = DataSaveFormat.CSV
+    COMPRESS        : bool = False
+
+    def __post_init__(self):
+        if isinstance(self.FORMAT, str):
+            self.FORMAT = DataSaveFormat.__members__[self.FORMAT]
+        super().__post_init__()
 
     def valid_check(self) -> None:
         pass
@@ -76,3 +91,9 @@ class MachineConfig:
 class DAQSystemConfig:
     NI_DEVICES          : List[NIDeviceConfig]
     MACHINES            : List[MachineConfig]
+
+    # 이상 탐지 추론 워커 프로세스 수와 대기 배치 상한
+    INFERENCE_WORKERS   : int = 1
+    INFERENCE_QUEUE     : int = 4
+    # 날짜 변경 시 외부 경로로 파일을 옮길 때 최대 복사 속도 (MiB/s, 0 이면 제한 없음)
+    FILE_MOVE_RATE      : int = 20
@@ -20,9 +20,11 @@ class QDAQSystemMonitor(QWidget):
 
         self._machines: Dict[str, Machine] = {m.get_name(): m for m in bg_system.get_machines()}
         self._m_confs: Dict[str, MachineConfig] = {m_conf.NAME: m_conf for m_conf in self._conf.MACHINES}
+        sensor_rates: Dict[str, int] = {s_conf.NAME: d_conf.RATE
+                                        for d_conf in self._conf.NI_DEVICES for s_conf in d_conf.SENSORS}
 
         """ Set main components """
-        self.machine_widget = QMachine(self)
+        self.machine_widget = QMachine(self, sensor_rates)
         self._bg_system.event_signal.connect(self.machine_widget.event_handle)
         self.set_monitoring_target.connect(self._bg_system.set_monitoring_target)
 
@@ -1,6 +1,5 @@
 import os
 from typing import List, Dict, Tuple
-from scipy import signal
 
 from PySide6 import QtCore
 from PySide6.QtCore import Qt, QUrl
@@ -11,19 +10,24 @@ from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QVBoxLayout, QStacke
 from background.machine.machine_event import MachineEvent
 from config import MachineConfig, DataSaveModeConfig, DataSendModeConfig
 from config.paths import BTN_FOLDER_ENABLE_IMG, BTN_FOLDER_DISABLE_IMG
+from lib.daq import DataChunk
+from lib.resample import BlockAverageDecimator
 from .realtime_chart import QRealtimeChart
 
 
 MAXIMUM_VIEW = 400
+# 차트에 추가하는 초당 최대 샘플 수
 MAXIMUM_BATCH = int(MAXIMUM_VIEW * 0.05)
 
 
 class QMachine(QWidget):
-    def __init__(self, parent: QWidget):
+    def __init__(self, parent: QWidget, sensor_rates: Dict[str, int]):
         super().__init__(parent)
         """ Set environ """
         self._m_conf: MachineConfig = None
+        self._sensor_rates: Dict[str, int] = sensor_rates
         self.charts: Dict[str, QRealtimeChart] = {}
+        self.resamplers: Dict[str, BlockAverageDecimator] = {}
 
         """ Set layout """
         self.layout = QHBoxLayout(self)
@@ -151,6 +155,7 @@ class QMachine(QWidget):
                 widget.deleteLater()
                 self.chart_stack.removeWidget(widget)
         self.charts = {}
+        self.resamplers = {}
 
         self.name_label.setText(self._m_conf.NAME)
 
@@ -207,6 +212,10 @@ class QMachine(QWidget):
             self.sensor_table.setItem(idx, 0, table_item)
             self.chart_stack.addWidget(new_chart)
             self.charts[sensor] = new_chart
+            rate = self._sensor_rates.get(sensor, 0)
+            if rate > MAXIMUM_BATCH:
+                # 표시용이므로 가장 가벼운 구간 평균으로 축소
+                self.resamplers[sensor] = BlockAverageDecimator(rate, MAXIMUM_BATCH)
 
     def fault_detect_disable(self) -> None:
         self.fd_res_label.setText('DISABLE')
@@ -238,11 +247,11 @@ class QMachine(QWidget):
         elif event is MachineEvent.FaultDetect:
             self.e_fault_detect(data)
 
-    def e_data_update(self, named_data: Dict[str, List[float]]) -> None:
+    def e_data_update(self, named_data: DataChunk) -> None:
         for name, datas in named_data.items():
             if name in self.charts:
-                if len(datas) > MAXIMUM_BATCH:
-                    datas = signal.resample(datas, MAXIMUM_BATCH)
+                if name in self.resamplers:
+                    datas = self.resamplers[name].process(datas)
                 self.charts[name].append_data(datas)
 
     def e_fault_detect(self, result: Dict[str, int]) -> None:
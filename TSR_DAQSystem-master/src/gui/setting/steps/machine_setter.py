@@ -6,9 +6,9 @@ import yaml
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont, QIntValidator, QCloseEvent, QPalette, QColor
 from PySide6.QtWidgets import QVBoxLayout, QHBoxLayout, QTableWidget, QWidget, QLabel, QPushButton, QAbstractItemView, \
-    QHeaderView, QTableWidgetItem, QLineEdit, QCheckBox, QGridLayout, QFileDialog, QDialog, QMessageBox
+    QHeaderView, QTableWidgetItem, QLineEdit, QCheckBox, QGridLayout, QFileDialog, QDialog, QMessageBox, QComboBox
 
-from config import DAQSystemConfig, MachineConfig, DataSendModeConfig, DataSaveModeConfig
+from config import DAQSystemConfig, MachineConfig, DataSendModeConfig, DataSaveModeConfig, DataSaveFormat
 from config.paths import BTN_ADD_NORMAL_IMG, BTN_ADD_HOVER_IMG, BTN_REMOVE_NORMAL_IMG, BTN_REMOVE_HOVER_IMG, \
     BTN_LEFT_NORMAL_IMG, BTN_LEFT_HOVER_IMG, BTN_RIGHT_HOVER_IMG, BTN_RIGHT_NORMAL_IMG, BTN_FOLDER_FIND_IMG, MODEL_DIR
 from lib.lstm_ae import ModelConfig
@@ -302,6 +302,7 @@ class QMachineEditor(QWidget):
         self.fault_detect_threshold = QLineEdit()
         self.save_checkbox = QCheckBox()
         self.save_path_input = QLineEdit()
+        self.save_format_input = QComboBox()
         self.send_checkbox = QCheckBox()
         self.send_host_input = QLineEdit()
         self.send_port_input = QLineEdit()
@@ -348,6 +349,9 @@ class QMachineEditor(QWidget):
         self.fault_detect_threshold.setMaximumWidth(80)
         self.fault_detect_threshold.setValidator(QIntValidator())
 
+        for save_format in DataSaveFormat:
+            self.save_format_input.addItem(save_format.name)
+
         self.send_host_input.setPlaceholderText('Host')
         self.send_port_input.setPlaceholderText('Port')
         self.send_port_input.setMaximumWidth(80)
@@ -382,6 +386,7 @@ class QMachineEditor(QWidget):
         info_layout.addWidget(self.save_checkbox, 2, 1)
         info_layout.addWidget(self.save_path_input, 2, 2, 1, 2)
         info_layout.addWidget(self.set_save_path_btn, 2, 4)
+        info_layout.addWidget(self.save_format_input, 2, 5)
 
         info_layout.addWidget(QLabel('Data Send : '), 3, 0)
         info_layout.addWidget(self.send_checkbox, 3, 1)
@@ -414,9 +419,11 @@ class QMachineEditor(QWidget):
         if self.save_checkbox.isChecked():
             self.save_path_input.setEnabled(True)
             self.set_save_path_btn.setEnabled(True)
+            self.save_format_input.setEnabled(True)
         else:
             self.save_path_input.setEnabled(False)
             self.set_save_path_btn.setEnabled(False)
+            self.save_format_input.setEnabled(False)
 
     def send_state_change(self):
         if self.send_checkbox.isChecked():
@@ -447,6 +454,7 @@ class QMachineEditor(QWidget):
 
             self.save_checkbox.setChecked(self._m_conf.DATA_SAVE_MODE.ACTIVATION)
             self.save_path_input.setText(self._m_conf.DATA_SAVE_MODE.PATH)
+            self.save_format_input.setCurrentText(self._m_conf.DATA_SAVE_MODE.FORMAT.name)
 
             self.send_checkbox.setChecked(self._m_conf.DATA_SEND_MODE.ACTIVATION)
             self.send_host_input.setText(self._m_conf.DATA_SEND_MODE.HOST)
@@ -474,6 +482,7 @@ class QMachineEditor(QWidget):
 
         self._m_conf.DATA_SAVE_MODE.ACTIVATION = self.save_checkbox.isChecked()
         self._m_conf.DATA_SAVE_MODE.PATH = self.save_path_input.text()
+        self._m_conf.DATA_SAVE_MODE.FORMAT = DataSaveFormat.__members__[self.save_format_input.currentText()]
 
         self._m_conf.DATA_SEND_MODE.ACTIVATION = self.send_checkbox.isChecked()
         self._m_conf.DATA_SEND_MODE.HOST = self.send_host_input.text()
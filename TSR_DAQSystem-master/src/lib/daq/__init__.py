@@ -1,2 +1,3 @@
 from .daq import DAQ
 from .data_handler import DataHandler
+from .data_chunk import DataChunk
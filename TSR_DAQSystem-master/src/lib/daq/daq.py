@@ -1,9 +1,10 @@
 import nidaqmx
 import asyncio
-from typing import List, Dict
+from typing import List
 
 from .ni_device import NIDevice
 from .data_handler import DataHandler
+from .data_chunk import DataChunk
 
 
 class DAQ:
@@ -20,27 +21,31 @@ class DAQ:
             self._data_handlers.remove(data_handler)
 
     def read_start(self) -> None:
-        # 장치별 비동기 읽기 루프 시작
+        # 장치별 읽기 스레드와 비동기 소비 루프 시작
         for ni_device in self._ni_devices:
+            ni_device.start()
             self._loop.create_task(self._read_loop(ni_device))
 
+    def read_stop(self) -> None:
+        for ni_device in self._ni_devices:
+            ni_device.stop()
+
     async def _read_loop(self, device: NIDevice) -> None:
-        # 장치에서 주기적으로 데이터 읽기
+        # 읽기 스레드가 청크를 채울 때까지 대기 (루프는 블로킹되지 않음)
         while True:
             try:
-                named_datas = await device.read()
+                chunk = await device.read()
                 # 핸들러로 데이터 전달 (머신/GUI 등)
-                self._loop.create_task(self._data_notify(device.name(), named_datas))
-                await asyncio.sleep(1)
+                self._loop.create_task(self._data_notify(device.name(), chunk))
             except nidaqmx.errors.DaqReadError:
                 pass
             except Exception as err:
                 print(f'Undefined Error : \n{str(err)}')
 
-    async def _data_notify(self, device_name: str, named_datas: Dict[str, List[float]]) -> None:
-        # 등록된 핸들러에 브로드캐스트
+    async def _data_notify(self, device_name: str, chunk: DataChunk) -> None:
+        # 등록된 핸들러에 브로드캐스트 (같은 배열을 공유하므로 핸들러는 수정하지 않음)
         for handler in self._data_handlers:
             try:
-                self._loop.create_task(handler.data_update(device_name, named_datas))
+                self._loop.create_task(handler.data_update(device_name, chunk))
             except Exception as err:
                 print(f'Data Handling Error : \n{str(err)}')
@@ -0,0 +1,46 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple
+
+
+@dataclass
+class DataChunk:
+    """
+        한 번의 읽기로 얻은 다채널 데이터
+        datas 는 (채널 수, 샘플 수) 2차원 배열이고, channel_index 로 센서 이름 → 행 번호를 찾는다.
+    """
+    datas           : np.ndarray
+    channel_index   : Dict[str, int]
+    rate            : int
+
+    def __len__(self) -> int:
+        return self.datas.shape[-1]
+
+    def __contains__(self, sensor: str) -> bool:
+        return sensor in self.channel_index
+
+    def __getitem__(self, sensor: str) -> np.ndarray:
+        return self.datas[self.channel_index[sensor]]
+
+    def sensors(self) -> List[str]:
+        return list(self.channel_index.keys())
+
+    def items(self) -> Iterator[Tuple[str, np.ndarray]]:
+        # 센서별 1차원 뷰 (복사 없음)
+        for sensor, idx in self.channel_index.items():
+            yield sensor, self.datas[idx]
+
+    def select(self, sensors: List[str]) -> 'DataChunk':
+        # 일부 센서만 골라낸 청크, 행이 연속이면 슬라이스 뷰로 복사 없이 반환
+        targets = [(self.channel_index[sensor], sensor) for sensor in sensors if sensor in self.channel_index]
+        targets.sort()
+        rows = [idx for idx, _ in targets]
+        if len(rows) == self.datas.shape[0]:
+            datas = self.datas
+        elif len(rows) and rows[-1] - rows[0] + 1 == len(rows):
+            datas = self.datas[rows[0]:rows[-1] + 1]
+        else:
+            datas = self.datas[rows]
+        return DataChunk(datas=datas,
+                         channel_index={sensor: idx for idx, (_, sensor) in enumerate(targets)},
+                         rate=self.rate)
@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
+
+from .data_chunk import DataChunk
 
 
 class DataHandler(ABC):
     @abstractmethod
-    async def data_update(self, device_name: str, named_datas: Dict[str, List[float]]) -> None:
+    async def data_update(self, device_name: str, chunk: DataChunk) -> None:
         pass
@@ -1 +1,2 @@
-from .ni_device import NIDevice
+from .ni_device import NIDevice, AcquisitionStats
+from .simulated_task import SimulatedTask
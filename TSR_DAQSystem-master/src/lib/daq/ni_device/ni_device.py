@@ -1,28 +1,67 @@
+import time
+import asyncio
+import threading
 import nidaqmx
 import nidaqmx.constants
-from scipy import signal
+import nidaqmx.errors
+from nidaqmx.stream_readers import AnalogMultiChannelReader
 from typing import List, Dict
+from dataclasses import dataclass
 
+from lib.resample import PolyphaseResampler
+from ..data_chunk import DataChunk
 from .channel_initializers import ChannelInitializer
+from .ring_buffer import ChunkRingBuffer
 
 MIN_RATE: int = 3000
+RING_SLOTS: int = 8
+# 한 주기에 읽을 수 있는 최대 길이 (청크 길이 배수)
+MAX_CHUNK_FACTOR: int = 4
+
+
+@dataclass
+class AcquisitionStats:
+    periods         : int = 0
+    chunks          : int = 0
+    samples         : int = 0
+    overruns        : int = 0      # 장치 버퍼 오버플로 또는 링 버퍼 덮어쓰기
+    underruns       : int = 0      # 주기 도래 시 읽을 샘플이 크게 부족했던 횟수
+    skipped_periods : int = 0      # 한 주기 이상 늦어 건너뛴 주기 수
+    max_jitter      : float = 0.0  # 예정 시각 대비 최대 지연 (초)
+    mean_jitter     : float = 0.0
 
 
 class NIDevice:
     def __init__(self,
                  name,
                  rate,
-                 channel_initializer: ChannelInitializer):
+                 channel_initializer: ChannelInitializer,
+                 chunk_duration: float = 1.0,
+                 task=None):
         self._name: str = name
         self._rate: int = rate
         # NI-DAQ 최소 샘플링 제약을 고려한 실제 샘플링 레이트
         self._real_rate: int = rate if rate > MIN_RATE else MIN_RATE
+        # 읽기 주기와 주기당 기대 샘플 수
+        self._chunk_duration: float = chunk_duration
+        self._chunk_size: int = max(1, round(self._real_rate * chunk_duration))
         self._sensor_names: List[str] = []
-        self._is_single_channel = False
+        self._channel_index: Dict[str, int] = {}
 
-        self._task = nidaqmx.Task()
+        # task 미지정 시 실제 장치 사용 (시뮬레이션은 SimulatedTask 전달)
+        self._task = task if task is not None else nidaqmx.Task()
         self._channel_initializer = channel_initializer
 
+        self._loop = asyncio.get_event_loop()
+        self._ring: ChunkRingBuffer = None
+        self._chunk_ready = asyncio.Event()
+        self._stop_event = threading.Event()
+        self._reader_thread: threading.Thread = None
+        self._stats = AcquisitionStats()
+
+        # 실제 레이트 → 설정 레이트 변환 (청크 간 필터 상태 유지)
+        self._resampler = PolyphaseResampler(self._real_rate, self._rate) if self._rate != self._real_rate else None
+
     def _set_timing(self, rate: int, samples_per_channel: int) -> None:
         self._task.timing.cfg_samp_clk_timing(rate=rate,
                                               active_edge=nidaqmx.constants.Edge.RISING,
@@ -33,19 +72,100 @@ class NIDevice:
         physical_channel = f'{self._name}/{channel}'
         self._channel_initializer.add_channel(self._task, physical_channel, **options)
 
+        self._channel_index[sensor_name] = len(self._sensor_names)
         self._sensor_names.append(sensor_name)
-        self._is_single_channel = len(self._sensor_names) == 1
 
         self._set_timing(rate=self._real_rate,
-                         samples_per_channel=self._real_rate*2)
-
-    async def read(self) -> Dict[str, List[float]]:
-        # 실제 샘플링 레이트로 읽은 뒤 설정 레이트로 리샘플링
-        data_list = self._task.read(number_of_samples_per_channel=self._real_rate)
-        data_list = [data_list] if self._is_single_channel else data_list
-        data_list = [signal.resample(data, self._rate).tolist() for data in data_list]
-        named_datas = dict(zip(self._sensor_names, data_list))
-        return named_datas
+                         samples_per_channel=max(self._real_rate*2, self._chunk_size*MAX_CHUNK_FACTOR*2))
+
+    def _create_reader(self):
+        # 실제 장치는 numpy 버퍼에 직접 읽는 스트림 리더 사용
+        if isinstance(self._task, nidaqmx.Task):
+            return AnalogMultiChannelReader(self._task.in_stream)
+        return self._task
+
+    def start(self) -> None:
+        # 장치 전용 읽기 스레드 시작
+        if self._reader_thread is not None:
+            return
+        self._ring = ChunkRingBuffer(channels=len(self._sensor_names),
+                                     chunk_size=self._chunk_size*MAX_CHUNK_FACTOR,
+                                     slots=RING_SLOTS)
+        self._stop_event.clear()
+        self._reader_thread = threading.Thread(target=self._acquire_loop,
+                                               name=f'{self._name}-reader',
+                                               daemon=True)
+        self._reader_thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._reader_thread is not None:
+            self._reader_thread.join(timeout=3)
+            self._reader_thread = None
+        self._task.close()
+
+    def _acquire_loop(self) -> None:
+        # 블로킹 읽기는 이 스레드에서만 수행하고, 이벤트 루프에는 청크 준비 신호만 보냄
+        reader = self._create_reader()
+        self._task.start()
+
+        # 단조 시계 기준 고정 주기로 깨어나 버퍼에 쌓인 만큼만 읽음 (읽기 시간이 주기에 누적되지 않음)
+        period = self._chunk_duration
+        deadline = time.monotonic() + period
+        jitter_sum = 0.0
+        while not self._stop_event.wait(max(0.0, deadline - time.monotonic())):
+            jitter = time.monotonic() - deadline
+            if jitter > period:
+                skipped = int(jitter // period)
+                self._stats.skipped_periods += skipped
+                deadline += skipped * period
+            deadline += period
+
+            try:
+                self._read_available(reader)
+            except nidaqmx.errors.DaqError:
+                self._stats.overruns += 1
+            except Exception as err:
+                print(f'{self._name} Read Error : \n{str(err)}')
+                self._stop_event.wait(1)
+                deadline = time.monotonic() + period
+
+            jitter_sum += max(0.0, jitter)
+            self._stats.periods += 1
+            self._stats.max_jitter = max(self._stats.max_jitter, jitter)
+            self._stats.mean_jitter = jitter_sum / self._stats.periods
+
+    def _read_available(self, reader) -> None:
+        available = self._task.in_stream.avail_samp_per_chan
+        # 기대 길이의 절반도 쌓이지 않았다면 언더런으로 집계
+        if available < self._chunk_size // 2:
+            self._stats.underruns += 1
+            if available == 0:
+                return
+
+        slot = self._ring.write_slot()
+        count = reader.read_many_sample(slot,
+                                        number_of_samples_per_channel=min(available, slot.shape[1]))
+        self._ring.commit(count)
+        self._stats.chunks += 1
+        self._stats.samples += count
+        self._loop.call_soon_threadsafe(self._chunk_ready.set)
+
+    async def read(self) -> DataChunk:
+        # 읽기 스레드가 채운 청크를 기다렸다가 설정 레이트로 리샘플링
+        data = self._ring.pop()
+        while data is None:
+            self._chunk_ready.clear()
+            await self._chunk_ready.wait()
+            data = self._ring.pop()
+
+        if self._resampler is not None:
+            data = self._resampler.process(data)
+        return DataChunk(datas=data, channel_index=self._channel_index, rate=self._rate)
+
+    def stats(self) -> AcquisitionStats:
+        ring_overruns = 0 if self._ring is None else self._ring.overruns
+        return AcquisitionStats(**{**self._stats.__dict__, 'overruns': self._stats.overruns + ring_overruns})
 
     def name(self) -> str:
         return self._name
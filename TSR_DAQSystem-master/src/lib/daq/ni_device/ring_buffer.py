@@ -0,0 +1,62 @@
+import threading
+import numpy as np
+from typing import Optional
+
+
+class ChunkRingBuffer:
+    """
+        장치 읽기 스레드와 이벤트 루프 사이에서 쓰이는 고정 크기 청크 링 버퍼
+        슬롯마다 (채널 수, 청크 길이) C-contiguous 배열을 미리 할당해 두고,
+        읽기 스레드는 슬롯에 직접 샘플을 채운 뒤 commit 한다.
+    """
+    def __init__(self, channels: int, chunk_size: int, slots: int = 8, dtype=np.float64):
+        self._slots: np.ndarray = np.zeros((slots, channels, chunk_size), dtype=dtype)
+        self._lengths: np.ndarray = np.zeros(slots, dtype=np.int64)
+        self._lock = threading.Lock()
+
+        self._head: int = 0     # 다음에 읽을 슬롯
+        self._size: int = 0     # 읽지 않은 슬롯 수
+        self.overruns: int = 0  # 소비가 늦어 덮어쓴 청크 수
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._size
+
+    def capacity(self) -> int:
+        return self._slots.shape[0]
+
+    def chunk_size(self) -> int:
+        return self._slots.shape[2]
+
+    def write_slot(self) -> np.ndarray:
+        # 다음에 채울 슬롯 반환 (가득 차 있으면 가장 오래된 청크를 버림)
+        with self._lock:
+            if self._size == self.capacity():
+                self._head = (self._head + 1) % self.capacity()
+                self._size -= 1
+                self.overruns += 1
+            tail = (self._head + self._size) % self.capacity()
+            return self._slots[tail]
+
+    def commit(self, length: int) -> None:
+        # write_slot 으로 받은 슬롯에 length 만큼 채웠음을 알림
+        with self._lock:
+            tail = (self._head + self._size) % self.capacity()
+            self._lengths[tail] = length
+            self._size += 1
+
+    def pop(self) -> Optional[np.ndarray]:
+        # 가장 오래된 청크를 복사해 반환 (비어 있으면 None)
+        with self._lock:
+            if self._size == 0:
+                return None
+            length = self._lengths[self._head]
+            chunk = self._slots[self._head, :, :length].copy()
+            self._head = (self._head + 1) % self.capacity()
+            self._size -= 1
+        return chunk
+
+    def clear(self) -> None:
+        with self._lock:
+            self._head = 0
+            self._size = 0
@@ -0,0 +1,114 @@
+import time
+import numpy as np
+import nidaqmx.errors
+from typing import List
+
+# NI-DAQ 버퍼 오버플로 에러 코드
+OVERFLOW_ERROR_CODE: int = -200279
+
+
+class SimulatedOverflowError(nidaqmx.errors.DaqError):
+    def __init__(self):
+        super().__init__('simulated input buffer overflow', OVERFLOW_ERROR_CODE)
+
+
+class _SimulatedChannels:
+    def __init__(self, task: 'SimulatedTask'):
+        self._task = task
+
+    def add_ai_accel_chan(self, physical_channel: str, **kwargs) -> None:
+        self._task.channel_names.append(physical_channel)
+
+    def add_ai_rtd_chan(self, physical_channel: str, **kwargs) -> None:
+        self._task.channel_names.append(physical_channel)
+
+
+class _SimulatedTiming:
+    def __init__(self, task: 'SimulatedTask'):
+        self._task = task
+
+    def cfg_samp_clk_timing(self, rate, active_edge=None, sample_mode=None, samps_per_chan=1000) -> None:
+        self._task.rate = rate
+        self._task.buffer_size = samps_per_chan
+
+
+class _SimulatedInStream:
+    def __init__(self, task: 'SimulatedTask'):
+        self._task = task
+
+    @property
+    def avail_samp_per_chan(self) -> int:
+        return self._task.available()
+
+
+class SimulatedTask:
+    """
+        하드웨어 없이 NIDevice 를 구동하기 위한 nidaqmx.Task 대체 객체
+        설정된 샘플링 레이트로 실시간에 맞춰 샘플이 쌓이고, 버퍼 크기를 넘기면 오버플로를 발생시킨다.
+    """
+    def __init__(self, amplitude: float = 1.0, frequency: float = 60.0, noise: float = 0.05):
+        self.channel_names: List[str] = []
+        self.rate: int = 1000
+        self.buffer_size: int = 2000
+
+        self.ai_channels = _SimulatedChannels(self)
+        self.timing = _SimulatedTiming(self)
+        self.in_stream = _SimulatedInStream(self)
+
+        self._amplitude = amplitude
+        self._frequency = frequency
+        self._noise = noise
+        self._rng = np.random.default_rng()
+
+        self._start_time: float = None
+        self._read_samples: int = 0
+
+    def start(self) -> None:
+        self._start_time = time.monotonic()
+        self._read_samples = 0
+
+    def stop(self) -> None:
+        self._start_time = None
+
+    def close(self) -> None:
+        self.stop()
+
+    def _produced(self) -> int:
+        if self._start_time is None:
+            self.start()
+        return int((time.monotonic() - self._start_time) * self.rate)
+
+    def available(self) -> int:
+        available = self._produced() - self._read_samples
+        if available > self.buffer_size:
+            # 실제 장치처럼 읽지 않은 샘플을 버리고 에러 발생
+            self._read_samples = self._produced()
+            raise SimulatedOverflowError()
+        return available
+
+    def _generate(self, start: int, count: int) -> np.ndarray:
+        t = (start + np.arange(count)) / self.rate
+        wave = self._amplitude * np.sin(2 * np.pi * self._frequency * t)
+        noise = self._rng.normal(0, self._noise, (len(self.channel_names), count))
+        return wave + noise
+
+    def read_many_sample(self, data: np.ndarray, number_of_samples_per_channel: int, timeout: float = 10.0) -> int:
+        # AnalogMultiChannelReader.read_many_sample 과 동일하게 data 에 직접 채움
+        count = number_of_samples_per_channel
+        deadline = time.monotonic() + timeout
+        while self.available() < count:
+            if time.monotonic() > deadline:
+                raise TimeoutError('simulated read timeout')
+            time.sleep((count - self.available()) / self.rate)
+
+        data[:, :count] = self._generate(self._read_samples, count)
+        self._read_samples += count
+        return count
+
+    def read(self, number_of_samples_per_channel: int = 1, timeout: float = 10.0):
+        # nidaqmx.Task.read 과 같은 리스트 형태로 반환
+        data = np.zeros((len(self.channel_names), number_of_samples_per_channel))
+        self.read_many_sample(data, number_of_samples_per_channel, timeout)
+        if len(self.channel_names) == 1:
+            return data[0].tolist()
+        return data.tolist()
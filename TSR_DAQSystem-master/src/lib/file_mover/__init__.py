@@ -0,0 +1 @@
+from .file_mover import FileMover, MoveReport
@@ -0,0 +1,159 @@
+import os
+import time
+import zlib
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+COPY_CHUNK: int = 1 << 20
+PART_SUFFIX: str = '.part'
+
+
+@dataclass
+class MoveReport:
+    src         : str
+    dest        : str
+    size        : int = 0
+    elapsed     : float = 0.0
+    attempts    : int = 0
+    success     : bool = False
+    error       : str = ''
+
+
+class FileMover:
+    """
+        기록이 끝난 파일을 외부 경로로 옮기는 백그라운드 작업자
+        같은 장치면 rename, 다른 장치면 속도 제한 복사 → fsync → CRC 검증 → 원본 삭제 순으로 처리하고,
+        실패 시 지정 횟수만큼 재시도한 뒤 결과를 MoveReport 로 남긴다.
+    """
+    def __init__(self,
+                 max_rate: int = 0,
+                 retries: int = 3,
+                 retry_delay: float = 5.0,
+                 verify: bool = True,
+                 on_complete: Optional[Callable[[MoveReport], None]] = None):
+        # max_rate : 초당 최대 복사 바이트 (0 이면 제한 없음)
+        self._max_rate = max_rate
+        self._retries = max(1, retries)
+        self._retry_delay = retry_delay
+        self._verify = verify
+        self._on_complete = on_complete
+
+        self._queue: 'queue.Queue[Optional[Tuple[str, str]]]' = queue.Queue()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread = None
+        self._reports: List[MoveReport] = []
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='file-mover', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 3.0) -> None:
+        # 진행 중인 복사는 중단하고 남은 작업은 다음 실행 때 다시 옮김
+        self._stop_event.set()
+        self._queue.put(None)
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def submit(self, src: str, dest: str) -> None:
+        self.start()
+        self._queue.put((src, dest))
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def reports(self) -> List[MoveReport]:
+        return list(self._reports)
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            job = self._queue.get()
+            if job is None:
+                break
+            report = self._move(*job)
+            self._reports.append(report)
+            if report.success:
+                print(f'File Moved : {report.src} -> {report.dest} '
+                      f'({report.size / 2 ** 20:.1f} MiB, {report.elapsed:.1f} s, {report.attempts} tries)')
+            else:
+                print(f'File Move Error : \n{report.src} -> {report.dest} : {report.error}')
+            if self._on_complete is not None:
+                self._on_complete(report)
+
+    def _move(self, src: str, dest: str) -> MoveReport:
+        report = MoveReport(src=src, dest=dest)
+        start = time.monotonic()
+        while report.attempts < self._retries and not self._stop_event.is_set():
+            report.attempts += 1
+            try:
+                report.size = os.path.getsize(src)
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                if os.stat(src).st_dev == os.stat(os.path.dirname(dest)).st_dev:
+                    # 같은 장치면 복사 없이 이름만 변경
+                    os.replace(src, dest)
+                else:
+                    self._copy(src, dest)
+                    os.remove(src)
+                report.success = True
+                break
+            except Exception as err:
+                report.error = str(err)
+                self._stop_event.wait(self._retry_delay * report.attempts)
+        report.elapsed = time.monotonic() - start
+        return report
+
+    def _copy(self, src: str, dest: str) -> None:
+        # 임시 파일에 복사한 뒤 검증이 끝나면 교체해 목적지에 불완전한 파일이 남지 않게 함
+        part = dest + PART_SUFFIX
+        try:
+            src_crc = self._throttled_copy(src, part)
+            if os.path.getsize(part) != os.path.getsize(src):
+                raise IOError('size mismatch after copy')
+            if self._verify and self._crc32(part) != src_crc:
+                raise IOError('checksum mismatch after copy')
+            os.replace(part, dest)
+        except Exception:
+            if os.path.exists(part):
+                os.remove(part)
+            raise
+
+    def _throttled_copy(self, src: str, dest: str) -> int:
+        crc = 0
+        copied = 0
+        start = time.monotonic()
+        with open(src, 'rb') as r_file, open(dest, 'wb') as w_file:
+            while True:
+                if self._stop_event.is_set():
+                    raise InterruptedError('file mover stopped')
+                block = r_file.read(COPY_CHUNK)
+                if not block:
+                    break
+                w_file.write(block)
+                crc = zlib.crc32(block, crc)
+                copied += len(block)
+
+                if self._max_rate:
+                    # 누적 복사량 기준으로 목표 속도를 넘으면 대기
+                    ahead = copied / self._max_rate - (time.monotonic() - start)
+                    if ahead > 0:
+                        self._stop_event.wait(ahead)
+            w_file.flush()
+            os.fsync(w_file.fileno())
+        return crc
+
+    @staticmethod
+    def _crc32(path: str) -> int:
+        # 목적지 파일을 다시 읽어 복사 중 계산한 원본 CRC 와 비교
+        crc = 0
+        with open(path, 'rb') as file:
+            while True:
+                block = file.read(COPY_CHUNK)
+                if not block:
+                    break
+                crc = zlib.crc32(block, crc)
+        return crc
@@ -1,2 +1,3 @@
 from .lstm_ae import LstmAE
-from .model_config import ModelConfig
+from .model_config import ModelConfig, load_model_configs
+from .inference_executor import InferenceExecutor, InferenceStats
@@ -1,4 +1,5 @@
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 from keras.models import Model
 from keras.layers import LSTM, RepeatVector, TimeDistributed, Dense
@@ -53,15 +54,14 @@ class BaseModel(Model):
 
         return decoded
 
-    def _data_to_input(self, data: list) -> object:
+    def _data_to_input(self, data: np.ndarray, stride: int = 1) -> np.ndarray:
         # LSTM의 입력 데이터로 변환하는 메소드
         # (입력 데이터 수, 시퀀스 길이, 사용할 컬럼 수)의 형태가 되어야 함
-        data_list = []
+        # 복사 없이 스트라이드 뷰로 윈도우를 만들고, 기존과 같이 마지막 윈도우는 제외
+        data = np.asarray(data).reshape(len(data), -1)
+        windows = sliding_window_view(data, self.seq_len, axis=0)[:len(data) - self.seq_len:stride]
 
-        for i in range(len(data) - self.seq_len):
-            data_list.append(data[i:(i + self.seq_len)])
-
-        return np.array(data_list)
+        return windows.transpose(0, 2, 1)
 
     def load(self, model_path: str) -> None:
         self.build((None, self.seq_len, self.input_dim))
@@ -0,0 +1,158 @@
+import os
+import time
+import asyncio
+import numpy as np
+import multiprocessing
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+
+from .model_config import load_model_configs
+
+# 워커 프로세스별로 한 번만 로드된 모델 {machine: {sensor: LstmAE}}
+_worker_models: Dict[str, dict] = {}
+
+
+def _init_worker(model_dir: str, machines: List[str], threads: int) -> None:
+    # 워커 시작 시 TF 스레드 수를 제한하고 모든 머신의 모델을 미리 로드
+    import tensorflow as tf
+    tf.config.threading.set_intra_op_parallelism_threads(threads)
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+
+    for machine in machines:
+        try:
+            _load_models(model_dir, machine)
+        except Exception as err:
+            print(f'{machine} Model Load Error : \n{str(err)}')
+
+
+def _load_models(model_dir: str, machine: str) -> dict:
+    from .lstm_ae import LstmAE
+
+    models = {}
+    for conf in load_model_configs(model_dir, machine):
+        model = LstmAE(seq_len=conf.SEQ_LEN,
+                       input_dim=1,
+                       latent_dim=conf.LATENT_DIM,
+                       batch_size=conf.BATCH_SIZE,
+                       threshold=conf.THRESHOLD,
+                       stride=conf.STRIDE)
+        model.load(os.path.join(model_dir, machine, f'{conf.NAME}.h5'))
+        models[conf.NAME] = model
+    _worker_models[machine] = models
+    return models
+
+
+def _detect(model_dir: str, machine: str, batches: Dict[str, np.ndarray]) -> int:
+    # 워커 프로세스에서 실행, 센서별 이상 윈도우 수의 합을 반환
+    models = _worker_models.get(machine)
+    if models is None:
+        models = _load_models(model_dir, machine)
+    return sum(models[name].detect(batch) for name, batch in batches.items())
+
+
+@dataclass
+class InferenceStats:
+    submitted       : int = 0
+    processed       : int = 0
+    dropped         : int = 0      # 추론이 밀려 버려진 배치 수 (오래된 것부터)
+    errors          : int = 0
+    queue_depth     : int = 0      # 대기 중인 배치 수
+    max_queue_depth : int = 0
+    in_flight       : int = 0      # 워커에서 실행 중인 배치 수
+    mean_latency    : float = 0.0  # 제출부터 결과까지 (초, 대기 시간 포함)
+    max_latency     : float = 0.0
+
+
+@dataclass
+class _Job:
+    machine     : str
+    batches     : Dict[str, np.ndarray]
+    submit_time : float
+    future      : asyncio.Future
+
+
+class InferenceExecutor:
+    """
+        이상 탐지 추론을 별도 프로세스 풀에서 수행하는 실행기
+        모든 머신이 공유하며, 워커는 시작 시 MODEL_DIR/<machine>/METADATA.yml 의 모델을 한 번만 로드한다.
+        대기열이 가득 차면 가장 오래된 배치를 버리고(결과 None) 최신 배치를 유지한다.
+    """
+    def __init__(self,
+                 model_dir: str,
+                 machines: List[str],
+                 workers: int = 1,
+                 max_queue: int = 4,
+                 threads: int = 2):
+        self._model_dir: str = model_dir
+        self._workers: int = max(1, workers)
+        self._max_queue: int = max(1, max_queue)
+
+        # TF 는 fork 후 사용이 안전하지 않으므로 spawn 사용 (Windows 기본값과 동일)
+        self._pool = ProcessPoolExecutor(max_workers=self._workers,
+                                         mp_context=multiprocessing.get_context('spawn'),
+                                         initializer=_init_worker,
+                                         initargs=(model_dir, machines, threads))
+        self._pending: Deque[_Job] = deque()
+        self._stats = InferenceStats()
+        self._latency_sum: float = 0.0
+
+    async def submit(self, machine: str, batches: Dict[str, np.ndarray]) -> Optional[int]:
+        # 배치를 대기열에 넣고 추론 결과를 기다림 (버려지거나 실패하면 None)
+        loop = asyncio.get_running_loop()
+        job = _Job(machine=machine, batches=batches, submit_time=time.monotonic(), future=loop.create_future())
+
+        if len(self._pending) >= self._max_queue:
+            dropped = self._pending.popleft()
+            dropped.future.set_result(None)
+            self._stats.dropped += 1
+        self._pending.append(job)
+        self._stats.submitted += 1
+        self._stats.max_queue_depth = max(self._stats.max_queue_depth, len(self._pending))
+        self._dispatch(loop)
+
+        return await job.future
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        # 워커 수만큼만 풀에 넘겨 나머지는 버릴 수 있는 대기열에 남김
+        while self._pending and self._stats.in_flight < self._workers:
+            job = self._pending.popleft()
+            self._stats.in_flight += 1
+            task = loop.run_in_executor(self._pool, _detect, self._model_dir, job.machine, job.batches)
+            task.add_done_callback(lambda done, job=job: self._complete(loop, job, done))
+
+    def _complete(self, loop: asyncio.AbstractEventLoop, job: _Job, done: asyncio.Future) -> None:
+        self._stats.in_flight -= 1
+        latency = time.monotonic() - job.submit_time
+
+        result = None
+        if done.cancelled():
+            self._stats.errors += 1
+        elif done.exception() is not None:
+            self._stats.errors += 1
+            print(f'{job.machine} Inference Error : \n{str(done.exception())}')
+        else:
+            result = done.result()
+            self._stats.processed += 1
+            self._latency_sum += latency
+            self._stats.mean_latency = self._latency_sum / self._stats.processed
+            self._stats.max_latency = max(self._stats.max_latency, latency)
+
+        if not job.future.done():
+            job.future.set_result(result)
+        self._dispatch(loop)
+
+    def stats(self) -> InferenceStats:
+        return InferenceStats(**{**self._stats.__dict__, 'queue_depth': len(self._pending)})
+
+    def reset_stats(self) -> None:
+        self._stats = InferenceStats(in_flight=self._stats.in_flight)
+        self._latency_sum = 0.0
+
+    def shutdown(self) -> None:
+        for job in self._pending:
+            if not job.future.done():
+                job.future.set_result(None)
+        self._pending.clear()
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -1,12 +1,10 @@
-
-import pandas as pd
 import numpy as np
 
-from pandas import DataFrame
-from sklearn.preprocessing import StandardScaler
-
 from .base_model import BaseModel
 
+# 한 번에 추론하는 최대 윈도우 수 (메모리 사용량 제한)
+INFERENCE_BATCH: int = 1024
+
 
 class LstmAE(BaseModel):
     def __init__(self,
@@ -14,25 +12,34 @@ class LstmAE(BaseModel):
                  input_dim: int,
                  latent_dim: int,
                  batch_size: int,
-                 threshold: float):
+                 threshold: float,
+                 stride: int = 1):
         super(LstmAE, self).__init__(seq_len=seq_len,
                                      input_dim=input_dim,
                                      latent_dim=latent_dim)
         self.batch_size = batch_size
         self.threshold = threshold
-
-        self.scaler = StandardScaler()
-
-    def detect(self, target: DataFrame) -> int:
-        target_input = self._data_to_input(self.scaler.fit_transform(target))
-        target_predict = self.__call__(target_input)
-        target_mae = np.mean(np.abs(target_predict - target_input), axis=1)
-
-        anomaly_df = pd.DataFrame(target[self.seq_len:])
-        anomaly_df['target_mae'] = target_mae
-        anomaly_df['threshold'] = self.threshold
-        anomaly_df['anomaly'] = anomaly_df['target_mae'] > anomaly_df['threshold']
-        anomaly_df['data'] = target[self.seq_len:]['data']
-        anomalies = anomaly_df.loc[anomaly_df['anomaly'] == True]
-
-        return len(anomalies)
+        # 윈도우 간격, 1보다 크면 일부 윈도우만 추론
+        self.stride = max(1, stride)
+
+    @staticmethod
+    def _standardize(target: np.ndarray) -> np.ndarray:
+        # StandardScaler.fit_transform 과 동일 (분산 0 이면 평균만 제거)
+        scale = target.std(axis=0)
+        scale[scale == 0] = 1.0
+        return (target - target.mean(axis=0)) / scale
+
+    def detect(self, target: np.ndarray) -> int:
+        target = np.asarray(target, dtype=np.float32).reshape(len(target), -1)
+        target_input = self._data_to_input(self._standardize(target), self.stride)
+
+        anomalies = 0
+        for start in range(0, len(target_input), INFERENCE_BATCH):
+            batch = np.ascontiguousarray(target_input[start:start + INFERENCE_BATCH])
+            # predict_on_batch 는 컴파일된 추론 함수를 재사용
+            batch_predict = self.predict_on_batch(batch)
+            batch_mae = np.mean(np.abs(batch_predict - batch), axis=1)
+            anomalies += int(np.count_nonzero(np.any(batch_mae > self.threshold, axis=1)))
+
+        # stride 로 건너뛴 윈도우까지 포함한 이상 윈도우 수로 환산
+        return anomalies * self.stride
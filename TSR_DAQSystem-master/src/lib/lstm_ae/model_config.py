@@ -1,3 +1,6 @@
+import os
+import yaml
+from typing import List
 from dataclasses import dataclass
 
 
@@ -8,3 +11,12 @@ class ModelConfig:
     LATENT_DIM      : int
     SEQ_LEN         : int
     THRESHOLD       : int
+    STRIDE          : int = 1
+    HOP             : int = 0      # 배치 간 진행 샘플 수 (0 이면 BATCH_SIZE, 작으면 배치가 겹침)
+
+
+def load_model_configs(model_dir: str, machine: str) -> List[ModelConfig]:
+    # 머신별 METADATA.yml 에서 모델 구성 로드
+    with open(os.path.join(model_dir, machine, 'METADATA.yml'), 'r', encoding='UTF-8') as yml:
+        cfg = yaml.safe_load(yml)
+    return [ModelConfig(**parm) for parm in cfg['MODELS']]
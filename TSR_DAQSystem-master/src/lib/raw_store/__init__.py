@@ -0,0 +1,2 @@
+from .raw_store import RawWriter, RawReader, RawChunkInfo
+from .converter import csv_to_raw, raw_to_csv
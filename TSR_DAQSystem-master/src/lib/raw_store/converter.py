@@ -0,0 +1,57 @@
+import os
+import numpy as np
+from datetime import datetime
+from time import localtime, strftime
+from typing import List
+
+from lib.csv_writer import CsvWriter
+from .raw_store import RawReader, RawWriter
+
+
+def _date_from_name(path: str) -> str:
+    # 기존 저장 규칙 YYYYMMDD_<sensor>.csv 에서 날짜 추출
+    return os.path.basename(path).split('_', 1)[0]
+
+
+def csv_to_raw(csv_path: str, raw_path: str, rate: int, date: str = None, compress: bool = False) -> int:
+    """
+        time,data CSV 를 .raw 로 변환, 같은 시각(HH:MM:SS) 행을 하나의 청크로 묶는다.
+        CSV 의 시각은 청크 수신 시각(마지막 샘플 근처)이므로 시작 시각은 샘플 수만큼 거슬러 계산한다.
+    """
+    date = date if date is not None else _date_from_name(csv_path)
+    writer = RawWriter(raw_path, compress=compress)
+    samples = 0
+
+    def write_group(time_str: str, values: List[float]) -> None:
+        end = datetime.strptime(f'{date} {time_str}', '%Y%m%d %H:%M:%S')
+        end_ns = int(end.timestamp()) * 1_000_000_000
+        writer.add_chunk(np.array(values, dtype=np.float32), rate, end_ns - len(values) * 1_000_000_000 // rate)
+
+    with open(csv_path, 'r', newline='') as file:
+        next(file, None)
+        cur_time, values = None, []
+        for line in file:
+            time_str, value = line.rstrip('\r\n').split(',', 1)
+            if time_str != cur_time and values:
+                write_group(cur_time, values)
+                samples += len(values)
+                values = []
+            cur_time = time_str
+            values.append(float(value))
+        if values:
+            write_group(cur_time, values)
+            samples += len(values)
+
+    writer.close()
+    return samples
+
+
+def raw_to_csv(raw_path: str, csv_path: str) -> int:
+    # .raw 를 기존 time,data CSV 형식으로 변환 (시각은 청크 끝 시각, 값은 float32 정밀도)
+    reader = RawReader(raw_path)
+    writer = CsvWriter(csv_path, ['time', 'data'])
+    for chunk in reader.chunks():
+        time_str = strftime('%H:%M:%S', localtime(chunk.end_ns() / 1_000_000_000))
+        writer.add_block(time_str, reader.chunk_samples(chunk))
+    writer.close()
+    return len(reader)
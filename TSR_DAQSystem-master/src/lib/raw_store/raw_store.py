@@ -0,0 +1,172 @@
+"""
+    센서별 추가 전용 바이너리 청크 파일 (.raw)
+    [헤더 28 bytes][float32 LE 샘플 또는 zlib 압축 샘플][4 byte 정렬 패딩] 이 반복된다.
+
+    헤더 : magic(4s) version(B) flags(B) reserved(H) rate(I) start_ns(q) count(I) payload_len(I)
+    - start_ns : 청크 첫 샘플의 epoch 시각 (ns), i 번째 샘플 시각은 start_ns + i * 1e9 / rate
+    - 비압축 청크는 numpy.memmap 위에서 복사 없이 읽을 수 있다.
+"""
+import os
+import zlib
+import struct
+import numpy as np
+from dataclasses import dataclass
+from typing import BinaryIO, List, Optional, Tuple
+
+MAGIC: bytes = b'TSRR'
+VERSION: int = 1
+FLAG_ZLIB: int = 0x01
+
+HEADER = struct.Struct('<4sBBHIqII')
+SAMPLE_DTYPE = np.dtype('<f4')
+
+
+def _padding(length: int) -> int:
+    return -length % 4
+
+
+@dataclass
+class RawChunkInfo:
+    offset      : int   # 페이로드 시작 위치
+    start_ns    : int
+    rate        : int
+    count       : int
+    payload_len : int
+    flags       : int
+
+    def end_ns(self) -> int:
+        # 마지막 샘플 다음 시각 (반열린 구간의 끝)
+        return self.start_ns + self.count * 1_000_000_000 // self.rate
+
+
+class RawWriter:
+    """
+        청크 단위로 float32 샘플을 추가하는 작성기 (CsvWriter 와 같은 rollover/flush/close 구성)
+    """
+    def __init__(self, path: str, compress: bool = False, buffer_size: int = 1 << 20):
+        self._compress = compress
+        self._buffer_size = buffer_size
+
+        self._path: str = None
+        self._file: BinaryIO = None
+        self.samples: int = 0
+        self.rollover(path)
+
+    def path(self) -> str:
+        return self._path
+
+    def rollover(self, path: str) -> None:
+        # 새 파일을 먼저 연 다음 교체하고 기존 파일을 닫음
+        if path == self._path and self._file is not None:
+            return
+        try:
+            file = open(path, 'ab', buffering=self._buffer_size)
+        except Exception as err:
+            print('Raw Open Error : \n', err)
+            return
+
+        prev_file, self._file, self._path = self._file, file, path
+        if prev_file is not None:
+            prev_file.close()
+
+    def add_chunk(self, datas: np.ndarray, rate: int, start_ns: int) -> None:
+        try:
+            payload = np.ascontiguousarray(datas, dtype=SAMPLE_DTYPE).tobytes()
+            flags = 0
+            if self._compress:
+                payload = zlib.compress(payload, 1)
+                flags |= FLAG_ZLIB
+
+            self._file.write(HEADER.pack(MAGIC, VERSION, flags, 0, rate, start_ns, len(datas), len(payload)))
+            self._file.write(payload)
+            self._file.write(b'\0' * _padding(len(payload)))
+            self.samples += len(datas)
+        except Exception as err:
+            print('Raw Write Error : \n', err)
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class RawReader:
+    """
+        .raw 파일을 memmap 으로 열어 청크 색인을 만들고 시각 구간으로 샘플을 잘라 읽는 리더
+        기록 중 끊겨 잘린 마지막 청크는 무시한다.
+    """
+    def __init__(self, path: str):
+        self._path = path
+        size = os.path.getsize(path)
+        self._map = np.memmap(path, dtype=np.uint8, mode='r') if size else np.empty(0, dtype=np.uint8)
+        self._chunks: List[RawChunkInfo] = self._scan()
+
+    def _scan(self) -> List[RawChunkInfo]:
+        chunks = []
+        offset = 0
+        buffer = self._map
+        while offset + HEADER.size <= len(buffer):
+            magic, version, flags, _, rate, start_ns, count, payload_len = HEADER.unpack_from(buffer, offset)
+            if magic != MAGIC or version != VERSION:
+                print(f'{self._path} Raw Format Error : \ninvalid chunk header at {offset}')
+                break
+            payload = offset + HEADER.size
+            if payload + payload_len > len(buffer):
+                break
+            chunks.append(RawChunkInfo(payload, start_ns, rate, count, payload_len, flags))
+            offset = payload + payload_len + _padding(payload_len)
+        return chunks
+
+    def chunks(self) -> List[RawChunkInfo]:
+        return self._chunks
+
+    def __len__(self) -> int:
+        return sum(chunk.count for chunk in self._chunks)
+
+    def time_range(self) -> Tuple[int, int]:
+        if not self._chunks:
+            return 0, 0
+        return self._chunks[0].start_ns, self._chunks[-1].end_ns()
+
+    def chunk_samples(self, chunk: RawChunkInfo) -> np.ndarray:
+        if chunk.flags & FLAG_ZLIB:
+            raw = zlib.decompress(self._map[chunk.offset:chunk.offset + chunk.payload_len].tobytes())
+            return np.frombuffer(raw, dtype=SAMPLE_DTYPE)
+        # 비압축 청크는 memmap 뷰 그대로 반환
+        return np.frombuffer(self._map, dtype=SAMPLE_DTYPE, count=chunk.count, offset=chunk.offset)
+
+    def read(self,
+             start_ns: Optional[int] = None,
+             end_ns: Optional[int] = None,
+             with_time: bool = False):
+        # [start_ns, end_ns) 구간의 샘플 반환, with_time 이면 (시각 배열, 샘플) 반환
+        parts, times = [], []
+        for chunk in self._chunks:
+            if (end_ns is not None and chunk.start_ns >= end_ns) or (start_ns is not None and chunk.end_ns() <= start_ns):
+                continue
+
+            first, last = 0, chunk.count
+            if start_ns is not None and start_ns > chunk.start_ns:
+                first = -((chunk.start_ns - start_ns) * chunk.rate // 1_000_000_000)
+            if end_ns is not None and end_ns < chunk.end_ns():
+                last = -((chunk.start_ns - end_ns) * chunk.rate // 1_000_000_000)
+            if first >= last:
+                continue
+
+            parts.append(self.chunk_samples(chunk)[first:last])
+            if with_time:
+                index = np.arange(first, last, dtype=np.int64)
+                times.append(chunk.start_ns + index * 1_000_000_000 // chunk.rate)
+
+        if len(parts) == 1:
+            samples = parts[0]
+        else:
+            samples = np.concatenate(parts) if parts else np.empty(0, dtype=SAMPLE_DTYPE)
+
+        if with_time:
+            return (np.concatenate(times) if times else np.empty(0, dtype=np.int64)), samples
+        return samples
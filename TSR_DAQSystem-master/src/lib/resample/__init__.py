@@ -0,0 +1 @@
+from .resampler import Resampler, PolyphaseResampler, BlockAverageDecimator
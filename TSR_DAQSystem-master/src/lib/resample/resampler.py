@@ -0,0 +1,135 @@
+import numpy as np
+from abc import ABC, abstractmethod
+from math import gcd
+from functools import lru_cache
+from typing import Tuple
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import signal
+
+# scipy.signal.resample_poly 기본값과 동일한 필터 설계 파라미터
+HALF_LEN_FACTOR: int = 10
+KAISER_BETA: float = 5.0
+
+
+def _reduce_ratio(in_rate: int, out_rate: int) -> Tuple[int, int]:
+    divisor = gcd(int(in_rate), int(out_rate))
+    return int(out_rate) // divisor, int(in_rate) // divisor
+
+
+@lru_cache(maxsize=32)
+def _polyphase_filter(up: int, down: int) -> Tuple[np.ndarray, int]:
+    """
+        (up, down) 비율의 안티에일리어싱 FIR 을 설계해 위상별로 분해
+        반환: (up, taps_per_phase) 형태의 위상 필터, 업샘플 단위 군지연
+    """
+    max_rate = max(up, down)
+    half_len = HALF_LEN_FACTOR * max_rate
+    taps = signal.firwin(2 * half_len + 1, 1.0 / max_rate, window=('kaiser', KAISER_BETA)) * up
+
+    taps_per_phase = -(-len(taps) // up)
+    padded = np.zeros(taps_per_phase * up)
+    padded[:len(taps)] = taps
+    # phases[p, k] = taps[p + (taps_per_phase - 1 - k) * up], 윈도우 순서에 맞춰 뒤집어 둠
+    phases = padded.reshape(taps_per_phase, up).T[:, ::-1].copy()
+    phases.setflags(write=False)
+    return phases, half_len
+
+
+class Resampler(ABC):
+    """
+        청크 단위로 들어오는 신호를 상태를 유지하며 리샘플링
+        입력은 (samples,) 또는 (channels, samples), 마지막 축을 따라 처리한다.
+    """
+    def __init__(self, in_rate: int, out_rate: int):
+        self.in_rate = int(in_rate)
+        self.out_rate = int(out_rate)
+
+    @abstractmethod
+    def process(self, data: np.ndarray) -> np.ndarray:
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        pass
+
+
+class PolyphaseResampler(Resampler):
+    """
+        유리수 비율 폴리페이즈 리샘플러 (resample_poly 의 스트리밍 버전)
+        청크 경계에서 필터 히스토리를 이어받으므로 경계 링잉이 없고,
+        필터 군지연만큼 출력이 늦게 시작된다.
+    """
+    def __init__(self, in_rate: int, out_rate: int):
+        super().__init__(in_rate, out_rate)
+        self._up, self._down = _reduce_ratio(self.in_rate, self.out_rate)
+        self._phases, self._delay = _polyphase_filter(self._up, self._down)
+        self._taps_per_phase = self._phases.shape[1]
+        self.reset()
+
+    def reset(self) -> None:
+        self._history: np.ndarray = None
+        # 다음 출력 샘플의 위치 (히스토리 시작 기준, 업샘플 단위), 군지연 보상 포함
+        self._pos: int = (self._taps_per_phase - 1) * self._up + self._delay
+
+    def process(self, data: np.ndarray) -> np.ndarray:
+        data = np.asarray(data, dtype=np.float64)
+        if self._history is None:
+            self._history = np.zeros(data.shape[:-1] + (self._taps_per_phase - 1,))
+        buf = np.concatenate((self._history, data), axis=-1)
+        length = buf.shape[-1]
+
+        # 현재 버퍼로 계산 가능한 출력 수
+        last = length * self._up - 1
+        count = 0 if self._pos > last else (last - self._pos) // self._down + 1
+
+        out = np.empty(buf.shape[:-1] + (count,))
+        if count > 0:
+            # 출력 j 의 위상은 up 주기로 반복되므로, 같은 위상끼리 스트라이드 윈도우 x 필터 행렬곱으로 계산
+            windows = sliding_window_view(buf, self._taps_per_phase, axis=-1)
+            for offset in range(min(self._up, count)):
+                position = self._pos + offset * self._down
+                phase = position % self._up
+                start = position // self._up - (self._taps_per_phase - 1)
+                stop = start + ((count - 1 - offset) // self._up) * self._down + 1
+                out[..., offset::self._up] = windows[..., start:stop:self._down, :] @ self._phases[phase]
+
+        consumed = length - (self._taps_per_phase - 1)
+        self._pos += count * self._down - consumed * self._up
+        self._history = buf[..., consumed:].copy()
+        return out
+
+
+class BlockAverageDecimator(Resampler):
+    """
+        출력 샘플마다 대응하는 입력 구간의 평균을 내는 데시메이터
+        온도처럼 느린 신호에 적합하며, 구간에 못 미친 샘플은 다음 청크로 넘긴다.
+    """
+    def __init__(self, in_rate: int, out_rate: int):
+        super().__init__(in_rate, out_rate)
+        if self.out_rate > self.in_rate:
+            raise ValueError('block average can only decimate')
+        self.reset()
+
+    def reset(self) -> None:
+        self._carry: np.ndarray = None
+        self._emitted: int = 0     # 지금까지 출력한 샘플 수
+        self._base: int = 0        # carry 첫 샘플의 누적 입력 인덱스
+
+    def process(self, data: np.ndarray) -> np.ndarray:
+        data = np.asarray(data, dtype=np.float64)
+        buf = data if self._carry is None else np.concatenate((self._carry, data), axis=-1)
+        end = self._base + buf.shape[-1]
+
+        # 출력 k 는 [k*in/out, (k+1)*in/out) 구간의 평균
+        count = (end * self.out_rate) // self.in_rate - self._emitted
+        bounds = (np.arange(self._emitted, self._emitted + count + 1) * self.in_rate) // self.out_rate - self._base
+        if count > 0:
+            sums = np.add.reduceat(buf[..., :bounds[-1]], bounds[:-1], axis=-1)
+            out = sums / np.diff(bounds)
+        else:
+            out = np.zeros(buf.shape[:-1] + (0,))
+
+        self._emitted += count
+        self._carry = buf[..., bounds[-1]:].copy()
+        self._base += bounds[-1]
+        return out
@@ -1,5 +1,6 @@
 import os
 import sys
+import multiprocessing
 
 from app import App
 
@@ -11,6 +12,8 @@ if sys.stdout is None:
     sys.stdout = open(os.devnull, 'w')
 
 if __name__ == '__main__':
+    # 배포(exe) 환경에서 추론 워커 프로세스 실행 지원
+    multiprocessing.freeze_support()
     # GUI 앱 시작 지점
     app = App()
     app.run()
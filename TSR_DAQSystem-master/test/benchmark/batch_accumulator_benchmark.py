@@ -0,0 +1,66 @@
+"""
+    이상 탐지 배치 누적 방식 비교
+    - legacy      : 리스트에 이어 붙이고 batch_size 로 자른 뒤 초과 샘플은 버림
+    - accumulator : 미리 할당한 BatchAccumulator (초과 샘플은 다음 배치로 이어짐)
+
+    청크 길이가 batch_size 의 배수가 아닐 때 버려지는 샘플 수와 처리 시간을 출력하고,
+    accumulator 의 배치가 원본 신호를 빠짐없이 이어 붙인 것인지(hop 적용 포함) 확인한다.
+
+    실행: python test/benchmark/batch_accumulator_benchmark.py (TSR_DAQSystem-master 기준)
+"""
+import os
+import sys
+import time
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from background.machine.batch_accumulator import BatchAccumulator
+
+RATE = 25600
+CHUNK_DURATION = 0.1
+BATCH_SIZE = 3000
+SECONDS = 60
+
+
+def legacy(chunks):
+    batch, batches, used = [], 0, 0
+    for chunk in chunks:
+        if len(batch) < BATCH_SIZE:
+            batch += chunk.tolist()
+        if len(batch) >= BATCH_SIZE:
+            batches += 1
+            used += BATCH_SIZE
+            batch = []
+    return batches, used
+
+
+def accumulate(chunks, hop=0):
+    acc = BatchAccumulator(BATCH_SIZE, hop)
+    batches = []
+    for chunk in chunks:
+        for batch in acc.push(chunk):
+            batches.append(batch.copy())
+    return batches
+
+
+if __name__ == '__main__':
+    signal = np.random.default_rng(0).normal(0, 1, RATE * SECONDS)
+    chunk_size = int(RATE * CHUNK_DURATION)
+    chunks = [signal[i:i + chunk_size] for i in range(0, len(signal), chunk_size)]
+
+    start = time.perf_counter()
+    count, used = legacy(chunks)
+    elapsed = time.perf_counter() - start
+    print(f'[legacy     ] {elapsed * 1000:7.1f} ms | batches : {count:5} | dropped samples : {len(signal) - used}')
+
+    for hop in (0, BATCH_SIZE // 2):
+        start = time.perf_counter()
+        batches = accumulate(chunks, hop)
+        elapsed = time.perf_counter() - start
+
+        step = hop or BATCH_SIZE
+        expected = [signal[i:i + BATCH_SIZE] for i in range(0, len(signal) - BATCH_SIZE + 1, step)]
+        matched = len(batches) == len(expected) and all(np.array_equal(a, b) for a, b in zip(batches, expected))
+        print(f'[hop {step:<7}] {elapsed * 1000:7.1f} ms | batches : {len(batches):5} | '
+              f'pending samples : {len(signal) - (len(batches) - 1) * step - BATCH_SIZE} | contiguous : {matched}')
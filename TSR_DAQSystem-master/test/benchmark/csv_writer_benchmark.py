@@ -0,0 +1,64 @@
+"""
+    CSV 저장 처리량 비교 (rows/s)
+    - legacy : 호출마다 파일 존재 확인 후 append 로 다시 열고, 샘플마다 [time, value] 리스트 생성
+    - buffer : 파일을 열어 둔 CsvWriter 에 청크 단위 add_block 기록
+
+    두 방식의 출력 파일이 바이트 단위로 같은지도 확인한다.
+    실행: python test/benchmark/csv_writer_benchmark.py (TSR_DAQSystem-master 기준)
+"""
+import os
+import sys
+import csv
+import time
+import tempfile
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from lib.csv_writer import CsvWriter
+
+RATE = 25600
+CHUNK_DURATION = 0.1
+CHUNKS = 200
+HEADER = ['time', 'data']
+
+
+def legacy_add_datas(path, datas):
+    if not os.path.isfile(path):
+        with open(path, 'w', newline='\n') as file:
+            csv.writer(file).writerow(HEADER)
+    with open(path, 'a', newline='\n') as file:
+        csv.writer(file).writerows(datas)
+
+
+def measure(name, func, rows):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f'[{name:6}] {rows / elapsed:12.0f} rows/s | {elapsed:6.2f} s')
+
+
+if __name__ == '__main__':
+    chunk_size = int(RATE * CHUNK_DURATION)
+    chunks = [np.random.default_rng(i).normal(0, 1, chunk_size) for i in range(CHUNKS)]
+    rows = chunk_size * CHUNKS
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = os.path.join(tmp, 'legacy.csv')
+        buffer_path = os.path.join(tmp, 'buffer.csv')
+
+        def legacy():
+            for chunk in chunks:
+                legacy_add_datas(legacy_path, [['12:00:00', value] for value in chunk.tolist()])
+
+        def buffered():
+            writer = CsvWriter(buffer_path, HEADER)
+            for chunk in chunks:
+                writer.add_block('12:00:00', chunk)
+            writer.close()
+
+        measure('legacy', legacy, rows)
+        measure('buffer', buffered, rows)
+
+        with open(legacy_path, 'rb') as a, open(buffer_path, 'rb') as b:
+            print(f'identical output : {a.read() == b.read()}')
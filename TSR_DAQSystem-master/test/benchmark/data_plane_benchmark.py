@@ -0,0 +1,64 @@
+"""
+    데이터 경로 메모리/CPU 비교 (8채널, 25.6 kS/s 시뮬레이션 장치)
+    - legacy : 채널별 tolist() → dict of list → 머신별 dict comprehension → 핸들러가 리스트 순회
+    - array  : DataChunk (채널 x 샘플 배열) → select 슬라이스 뷰 → 핸들러가 배열 직접 사용
+
+    실행: python test/benchmark/data_plane_benchmark.py (TSR_DAQSystem-master 기준)
+"""
+import os
+import sys
+import time
+import tracemalloc
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from lib.daq import DataChunk
+
+CHANNELS = 8
+RATE = 25600
+SECONDS = 30
+# 한 장치를 두 머신이 절반씩 나눠 쓰는 구성
+MACHINE_SENSORS = ([f's{idx}' for idx in range(0, 4)], [f's{idx}' for idx in range(4, 8)])
+SENSOR_NAMES = [f's{idx}' for idx in range(CHANNELS)]
+
+
+def legacy_path(raw: np.ndarray) -> float:
+    named_datas = dict(zip(SENSOR_NAMES, raw.tolist()))
+    total = 0.0
+    for sensors in MACHINE_SENSORS:
+        machine_datas = {sensor: data for sensor, data in named_datas.items() if sensor in sensors}
+        for data in machine_datas.values():
+            total += sum(map(abs, data)) / len(data)
+    return total
+
+
+def array_path(raw: np.ndarray) -> float:
+    chunk = DataChunk(datas=raw, channel_index={name: idx for idx, name in enumerate(SENSOR_NAMES)}, rate=RATE)
+    total = 0.0
+    for sensors in MACHINE_SENSORS:
+        machine_chunk = chunk.select(sensors)
+        for _, data in machine_chunk.items():
+            total += np.abs(data).mean()
+    return total
+
+
+def run(name: str, path) -> None:
+    rng = np.random.default_rng(0)
+    raw = rng.normal(size=(CHANNELS, RATE))
+
+    tracemalloc.start()
+    start = time.process_time()
+    for _ in range(SECONDS):
+        path(raw)
+    cpu = time.process_time() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f'[{name:6}] cpu per second of data : {cpu / SECONDS * 1000:8.3f} ms | '
+          f'peak allocation : {peak / 1024 / 1024:8.2f} MiB')
+
+
+if __name__ == '__main__':
+    run('legacy', legacy_path)
+    run('array', array_path)
@@ -0,0 +1,99 @@
+"""
+    날짜 변경 시 파일 이동 방식별 이벤트 루프 지연 비교
+    - legacy : 이벤트 루프에서 shutil.move 직접 실행
+    - mover  : FileMover 백그라운드 작업자 (속도 제한 복사 + fsync + CRC 검증)
+
+    다른 장치로 옮길 때의 복사 비용을 보려면 목적지를 다른 파일시스템으로 지정한다.
+    실행: python test/benchmark/file_mover_benchmark.py [목적지 경로] (TSR_DAQSystem-master 기준, 기본 /dev/shm)
+"""
+import os
+import sys
+import time
+import shutil
+import asyncio
+import tempfile
+import threading
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from lib.file_mover import FileMover
+
+FILES = 4
+FILE_SIZE = 64 * 2 ** 20
+MAX_RATE = 256 * 2 ** 20
+PERIOD = 0.1
+
+
+def create_files(directory: str):
+    paths = []
+    for idx in range(FILES):
+        path = os.path.join(directory, f'20240101_s{idx}.csv')
+        with open(path, 'wb') as file:
+            file.write(os.urandom(FILE_SIZE))
+        paths.append(path)
+    return paths
+
+
+async def ticker(lags: list, stop: asyncio.Event) -> None:
+    deadline = time.monotonic() + PERIOD
+    while not stop.is_set():
+        await asyncio.sleep(max(0.0, deadline - time.monotonic()))
+        lags.append(time.monotonic() - deadline)
+        deadline += PERIOD
+
+
+async def run(name: str, move, wait) -> None:
+    lags, stop = [], asyncio.Event()
+    task = asyncio.create_task(ticker(lags, stop))
+    await asyncio.sleep(PERIOD * 2)
+
+    start = time.monotonic()
+    move()
+    while not wait():
+        await asyncio.sleep(PERIOD)
+    elapsed = time.monotonic() - start
+    stop.set()
+    await task
+    print(f'[{name:6}] {FILES * FILE_SIZE / 2 ** 20:.0f} MiB in {elapsed:6.2f} s | loop lag max : {max(lags) * 1000:8.1f} ms')
+
+
+async def main(dest_root: str) -> None:
+    with tempfile.TemporaryDirectory() as src_dir, tempfile.TemporaryDirectory(dir=dest_root) as dest_dir:
+        same_device = os.stat(src_dir).st_dev == os.stat(dest_dir).st_dev
+        print(f'destination : {dest_dir} ({"rename" if same_device else "copy"})')
+
+        paths = create_files(src_dir)
+        await run('legacy', lambda: [shutil.move(path, os.path.join(dest_dir, 'legacy_' + os.path.basename(path)))
+                                     for path in paths], lambda: True)
+
+        paths = create_files(src_dir)
+        done = threading.Event()
+        reports = []
+
+        def on_complete(report):
+            reports.append(report)
+            if len(reports) == FILES:
+                done.set()
+
+        mover = FileMover(max_rate=MAX_RATE, on_complete=on_complete)
+        await run('mover', lambda: [mover.submit(path, os.path.join(dest_dir, os.path.basename(path)))
+                                    for path in paths], done.is_set)
+        print(f'moved : {sum(report.success for report in reports)}/{FILES} | '
+              f'sizes ok : {all(os.path.getsize(report.dest) == FILE_SIZE for report in reports)}')
+
+        # 목적지 폴더 자리에 파일이 있으면 재시도 후 실패 보고
+        blocker = os.path.join(dest_dir, 'blocked')
+        open(blocker, 'w').close()
+        failed = create_files(src_dir)[0]
+        mover.stop()
+        mover = FileMover(retries=3, retry_delay=0.05, on_complete=reports.append)
+        mover.submit(failed, os.path.join(blocker, 'x.csv'))
+        while len(reports) <= FILES:
+            await asyncio.sleep(PERIOD)
+        print(f'failure report : success={reports[-1].success}, attempts={reports[-1].attempts}, '
+              f'source kept={os.path.exists(failed)}')
+        mover.stop()
+
+
+if __name__ == '__main__':
+    asyncio.run(main(sys.argv[1] if len(sys.argv) > 1 else '/dev/shm'))
@@ -0,0 +1,100 @@
+"""
+    이상 탐지 추론 실행 방식별 이벤트 루프 지연 비교 (학습된 가중치 불필요)
+    - inline   : 기존처럼 이벤트 루프에서 LstmAE.detect 직접 실행
+    - executor : InferenceExecutor 프로세스 풀에 제출 후 결과 대기
+
+    임시 모델 폴더에 무작위 가중치 모델과 METADATA.yml 을 만들고,
+    수집 주기(100 ms) 마다 깨어나는 태스크의 지연과 추론 지연/버려진 배치 수를 출력한다.
+
+    실행: python test/benchmark/inference_executor_benchmark.py (TSR_DAQSystem-master 기준)
+"""
+import os
+import sys
+import time
+import yaml
+import asyncio
+import tempfile
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from lib.lstm_ae import LstmAE, InferenceExecutor
+
+MACHINE = 'bench'
+SENSORS = ['s0', 's1']
+SEQ_LEN = 30
+LATENT_DIM = 16
+BATCH_SIZE = 3000
+PERIOD = 0.1
+BATCHES = 10
+
+
+def create_models(model_dir: str) -> None:
+    os.makedirs(os.path.join(model_dir, MACHINE))
+    models = []
+    for sensor in SENSORS:
+        model = LstmAE(seq_len=SEQ_LEN, input_dim=1, latent_dim=LATENT_DIM, batch_size=BATCH_SIZE, threshold=0.5)
+        model.build((None, SEQ_LEN, 1))
+        model.save_weights(os.path.join(model_dir, MACHINE, f'{sensor}.h5'))
+        models.append({'NAME': sensor, 'BATCH_SIZE': BATCH_SIZE, 'LATENT_DIM': LATENT_DIM,
+                       'SEQ_LEN': SEQ_LEN, 'THRESHOLD': 0.5})
+    with open(os.path.join(model_dir, MACHINE, 'METADATA.yml'), 'w', encoding='UTF-8') as yml:
+        yaml.safe_dump({'MODELS': models}, yml)
+
+
+async def ticker(lags: list) -> None:
+    # 수집 루프 대용, 예정 시각 대비 늦게 깨어난 시간 기록
+    deadline = time.monotonic() + PERIOD
+    while True:
+        await asyncio.sleep(max(0.0, deadline - time.monotonic()))
+        lags.append(time.monotonic() - deadline)
+        deadline += PERIOD
+
+
+async def run(name: str, detect) -> None:
+    lags = []
+    batches = {sensor: np.random.default_rng(0).normal(0, 1, BATCH_SIZE) for sensor in SENSORS}
+    task = asyncio.create_task(ticker(lags))
+
+    start = time.perf_counter()
+    results = []
+    for _ in range(BATCHES):
+        results.append(asyncio.create_task(detect(batches)))
+        await asyncio.sleep(PERIOD)
+    results = await asyncio.gather(*results)
+    elapsed = time.perf_counter() - start
+    task.cancel()
+
+    print(f'[{name:8}] {elapsed:6.2f} s | loop lag max : {max(lags) * 1000:8.1f} ms, '
+          f'mean : {np.mean(lags) * 1000:7.1f} ms | results : {sum(r is not None for r in results)}/{BATCHES}')
+
+
+async def main(model_dir: str) -> None:
+    models = {}
+    for sensor in SENSORS:
+        models[sensor] = LstmAE(seq_len=SEQ_LEN, input_dim=1, latent_dim=LATENT_DIM, batch_size=BATCH_SIZE, threshold=0.5)
+        models[sensor].load(os.path.join(model_dir, MACHINE, f'{sensor}.h5'))
+
+    async def inline(batches):
+        return sum(models[name].detect(batch) for name, batch in batches.items())
+    await run('inline', inline)
+
+    executor = InferenceExecutor(model_dir=model_dir, machines=[MACHINE], workers=1, max_queue=2)
+    # 워커 시작과 모델 로드는 측정에서 제외
+    await executor.submit(MACHINE, {sensor: np.zeros(BATCH_SIZE) for sensor in SENSORS})
+    executor.reset_stats()
+
+    async def pooled(batches):
+        return await executor.submit(MACHINE, batches)
+    await run('executor', pooled)
+
+    stats = executor.stats()
+    print(f'           latency mean : {stats.mean_latency * 1000:.1f} ms, max : {stats.max_latency * 1000:.1f} ms | '
+          f'processed : {stats.processed} | dropped : {stats.dropped} | max queue : {stats.max_queue_depth}')
+    executor.shutdown()
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as tmp:
+        create_models(tmp)
+        asyncio.run(main(tmp))
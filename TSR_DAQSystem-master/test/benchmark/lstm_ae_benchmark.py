@@ -0,0 +1,58 @@
+"""
+    LSTM-AE 추론 속도 비교 (windows/s, 학습된 가중치 불필요)
+    - legacy : 파이썬 루프 윈도우 생성 + model.__call__ + pandas 로 이상 개수 집계
+    - fast   : sliding_window_view + predict_on_batch + numpy 집계 (stride 1, 4)
+
+    실행: python test/benchmark/lstm_ae_benchmark.py (TSR_DAQSystem-master 기준)
+"""
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from sklearn.preprocessing import StandardScaler
+from lib.lstm_ae import LstmAE
+
+SEQ_LEN = 30
+LATENT_DIM = 16
+BATCH_SIZE = 3000
+REPEAT = 3
+
+
+def legacy_detect(model: LstmAE, target: pd.DataFrame) -> int:
+    scaled = StandardScaler().fit_transform(target)
+    target_input = np.array([scaled[i:(i + model.seq_len)] for i in range(len(scaled) - model.seq_len)])
+    target_predict = model(target_input)
+    target_mae = np.mean(np.abs(target_predict - target_input), axis=1)
+
+    anomaly_df = pd.DataFrame(target[model.seq_len:])
+    anomaly_df['target_mae'] = target_mae
+    anomaly_df['threshold'] = model.threshold
+    anomaly_df['anomaly'] = anomaly_df['target_mae'] > anomaly_df['threshold']
+    return len(anomaly_df.loc[anomaly_df['anomaly'] == True])
+
+
+def measure(name: str, func, windows: int) -> None:
+    func()
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        result = func()
+    elapsed = (time.perf_counter() - start) / REPEAT
+    print(f'[{name:12}] {windows / elapsed:10.1f} windows/s | anomalies : {result}')
+
+
+if __name__ == '__main__':
+    data = np.sin(np.linspace(0, 200, BATCH_SIZE)) + np.random.default_rng(0).normal(0, 0.1, BATCH_SIZE)
+    windows = BATCH_SIZE - SEQ_LEN
+
+    for stride in (1, 4):
+        model = LstmAE(seq_len=SEQ_LEN, input_dim=1, latent_dim=LATENT_DIM,
+                       batch_size=BATCH_SIZE, threshold=0.5, stride=stride)
+        model.build((None, SEQ_LEN, 1))
+        if stride == 1:
+            frame = pd.DataFrame({'data': data})
+            measure('legacy', lambda: legacy_detect(model, frame), windows)
+        measure(f'fast (s={stride})', lambda: model.detect(data), windows)
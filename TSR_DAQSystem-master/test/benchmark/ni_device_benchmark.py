@@ -0,0 +1,82 @@
+"""
+    NIDevice 읽기 방식 비교 벤치마크 (하드웨어 불필요)
+    - legacy   : 이벤트 루프에서 블로킹 task.read 호출
+    - threaded : 장치별 읽기 스레드 + 링 버퍼
+
+    실행: python test/benchmark/ni_device_benchmark.py (TSR_DAQSystem-master 기준)
+"""
+import os
+import sys
+import time
+import asyncio
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from lib.daq.ni_device import NIDevice, SimulatedTask
+from lib.daq.ni_device.channel_initializers import VibChannelInitializer
+
+DEVICES = 4
+CHANNELS = 4
+RATE = 3000
+DURATION = 10
+
+
+def create_device(idx: int) -> NIDevice:
+    device = NIDevice(name=f'sim{idx}',
+                      rate=RATE,
+                      channel_initializer=VibChannelInitializer(),
+                      task=SimulatedTask())
+    for ch in range(CHANNELS):
+        device.add_sensor(sensor_name=f'sim{idx}_s{ch}', channel=f'ai{ch}', options={})
+    return device
+
+
+async def monitor_latency(lags: list, interval: float = 0.01):
+    # 이벤트 루프가 얼마나 늦게 깨어나는지 측정
+    while True:
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def legacy_loop(device: NIDevice, task: SimulatedTask, counter: list):
+    while True:
+        task.read(number_of_samples_per_channel=RATE)
+        counter[0] += 1
+        await asyncio.sleep(0)
+
+
+async def threaded_loop(device: NIDevice, counter: list):
+    while True:
+        await device.read()
+        counter[0] += 1
+
+
+async def run(mode: str):
+    lags, counter = [], [0]
+    devices = [create_device(idx) for idx in range(DEVICES)]
+    if mode == 'threaded':
+        for device in devices:
+            device.start()
+        tasks = [asyncio.create_task(threaded_loop(device, counter)) for device in devices]
+    else:
+        tasks = [asyncio.create_task(legacy_loop(device, device._task, counter)) for device in devices]
+    tasks.append(asyncio.create_task(monitor_latency(lags)))
+
+    await asyncio.sleep(DURATION)
+    for task in tasks:
+        task.cancel()
+    if mode == 'threaded':
+        for device in devices:
+            device.stop()
+
+    lags.sort()
+    print(f'[{mode:8}] chunks/s : {counter[0] / DURATION:6.2f} '
+          f'(expected {DEVICES:.2f}) | '
+          f'loop lag p50 : {lags[len(lags) // 2] * 1000:8.2f} ms | '
+          f'max : {lags[-1] * 1000:8.2f} ms')
+
+
+if __name__ == '__main__':
+    for mode in ('legacy', 'threaded'):
+        asyncio.run(run(mode))
@@ -0,0 +1,78 @@
+"""
+    원시 데이터 저장 형식 비교 (CSV vs RAW vs RAW+zlib)
+    25.6 kS/s 진동 신호를 100 ms 청크로 저장한 뒤 파일 크기, 저장 시간, 전체 재로딩 시간을 출력하고,
+    RAW 의 시각 구간 읽기 결과와 CSV <-> RAW 변환 샘플 수를 확인한다.
+
+    실행: python test/benchmark/raw_store_benchmark.py (TSR_DAQSystem-master 기준)
+"""
+import os
+import sys
+import time
+import tempfile
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from lib.csv_writer import CsvWriter
+from lib.raw_store import RawWriter, RawReader, csv_to_raw, raw_to_csv
+
+RATE = 25600
+CHUNK_DURATION = 0.1
+SECONDS = 60
+START_NS = 1_700_000_000 * 1_000_000_000
+
+
+def load_csv(path: str) -> np.ndarray:
+    with open(path, 'r') as file:
+        next(file)
+        return np.array([float(line.split(',', 1)[1]) for line in file], dtype=np.float32)
+
+
+if __name__ == '__main__':
+    chunk_size = int(RATE * CHUNK_DURATION)
+    rng = np.random.default_rng(0)
+    t = np.arange(RATE * SECONDS) / RATE
+    signal = np.sin(2 * np.pi * 60 * t) + rng.normal(0, 0.05, len(t))
+    chunks = [signal[i:i + chunk_size] for i in range(0, len(signal), chunk_size)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, '20240101_s0.csv')
+        start = time.perf_counter()
+        writer = CsvWriter(csv_path, ['time', 'data'])
+        for idx, chunk in enumerate(chunks):
+            writer.add_block(time.strftime('%H:%M:%S', time.localtime(START_NS / 1e9 + (idx + 1) * CHUNK_DURATION)), chunk)
+        writer.close()
+        write_time = time.perf_counter() - start
+        start = time.perf_counter()
+        load_csv(csv_path)
+        print(f'[csv     ] {os.path.getsize(csv_path) / 2 ** 20:7.2f} MiB | write : {write_time:6.3f} s | '
+              f'load : {time.perf_counter() - start:6.3f} s')
+
+        for compress in (False, True):
+            raw_path = os.path.join(tmp, f'20240101_s0_{int(compress)}.raw')
+            start = time.perf_counter()
+            writer = RawWriter(raw_path, compress=compress)
+            for idx, chunk in enumerate(chunks):
+                writer.add_chunk(chunk, RATE, START_NS + idx * chunk_size * 1_000_000_000 // RATE)
+            writer.close()
+            write_time = time.perf_counter() - start
+            start = time.perf_counter()
+            samples = np.asarray(RawReader(raw_path).read())
+            name = 'raw+zlib' if compress else 'raw'
+            print(f'[{name:8}] {os.path.getsize(raw_path) / 2 ** 20:7.2f} MiB | write : {write_time:6.3f} s | '
+                  f'load : {time.perf_counter() - start:6.3f} s | exact : {np.array_equal(samples, signal.astype(np.float32))}')
+
+        # 10.05 ~ 12.5 초 구간 읽기 (청크 경계와 어긋난 구간)
+        reader = RawReader(os.path.join(tmp, '20240101_s0_0.raw'))
+        begin, end = START_NS + 10_050_000_000, START_NS + 12_500_000_000
+        times, part = reader.read(begin, end, with_time=True)
+        expected = signal[int(10.05 * RATE):int(12.5 * RATE)].astype(np.float32)
+        print(f'range read : {len(part)} samples | match : {np.array_equal(part, expected)} | '
+              f'bounds : {times[0] >= begin and times[-1] < end}')
+
+        converted = os.path.join(tmp, '20240101_s0_conv.raw')
+        restored = os.path.join(tmp, '20240101_s0_conv.csv')
+        count = csv_to_raw(csv_path, converted, RATE)
+        raw_to_csv(converted, restored)
+        print(f'csv -> raw -> csv : {count} samples | '
+              f'values match (float32) : {np.array_equal(load_csv(restored), load_csv(csv_path))}')
@@ -0,0 +1,54 @@
+"""
+    단조 시계 기반 읽기 스케줄 측정 (하드웨어 불필요)
+    고정 레이트로 샘플을 만드는 SimulatedTask 에서 청크 주기별로 읽고,
+    수집 샘플 수 / 오버런 / 언더런 / 주기 지터를 출력한다.
+
+    실행: python test/benchmark/read_schedule_benchmark.py (TSR_DAQSystem-master 기준)
+"""
+import os
+import sys
+import asyncio
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from lib.daq.ni_device import NIDevice, SimulatedTask
+from lib.daq.ni_device.channel_initializers import VibChannelInitializer
+
+RATE = 25600
+CHANNELS = 4
+DURATION = 10
+CHUNK_DURATIONS = (1.0, 0.1)
+
+
+async def consume(device: NIDevice, counter: list):
+    while True:
+        chunk = await device.read()
+        counter[0] += len(chunk)
+
+
+async def run(chunk_duration: float):
+    device = NIDevice(name='sim',
+                      rate=RATE,
+                      channel_initializer=VibChannelInitializer(),
+                      chunk_duration=chunk_duration,
+                      task=SimulatedTask())
+    for ch in range(CHANNELS):
+        device.add_sensor(sensor_name=f's{ch}', channel=f'ai{ch}', options={})
+
+    counter = [0]
+    device.start()
+    consumer = asyncio.create_task(consume(device, counter))
+    await asyncio.sleep(DURATION)
+    consumer.cancel()
+    device.stop()
+
+    stats = device.stats()
+    print(f'[chunk {chunk_duration * 1000:6.1f} ms] '
+          f'samples : {counter[0]} / expected ~{RATE * DURATION} | '
+          f'chunks : {stats.chunks} | overruns : {stats.overruns} | underruns : {stats.underruns} | '
+          f'jitter mean : {stats.mean_jitter * 1000:.3f} ms, max : {stats.max_jitter * 1000:.3f} ms')
+
+
+if __name__ == '__main__':
+    for duration in CHUNK_DURATIONS:
+        asyncio.run(run(duration))
@@ -0,0 +1,57 @@
+"""
+    리샘플링 방식별 CPU 시간 비교 (신호 1초당)
+    - fft       : 청크마다 scipy.signal.resample (기존 방식)
+    - polyphase : lib.resample.PolyphaseResampler
+    - block_avg : lib.resample.BlockAverageDecimator
+
+    실행: python test/benchmark/resample_benchmark.py (TSR_DAQSystem-master 기준)
+"""
+import os
+import sys
+import time
+import numpy as np
+from scipy import signal
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from lib.resample import PolyphaseResampler, BlockAverageDecimator
+
+CHANNELS = 8
+SECONDS = 60
+# (경로, 입력 레이트, 출력 레이트)
+CASES = (
+    ('NIDevice.read', 3000, 1000),
+    ('DataSender.convert', 1000, 30),
+    ('QMachine.e_data_update', 3000, 20),
+)
+CHUNK_DURATIONS = (1.0, 0.1)
+
+
+def bench_fft(data: np.ndarray, chunk: int, out_rate: int, in_rate: int) -> float:
+    out_len = round(chunk * out_rate / in_rate)
+    start = time.process_time()
+    for idx in range(0, data.shape[1], chunk):
+        signal.resample(data[:, idx:idx + chunk], out_len, axis=1)
+    return time.process_time() - start
+
+
+def bench_stateful(resampler, data: np.ndarray, chunk: int) -> float:
+    start = time.process_time()
+    for idx in range(0, data.shape[1], chunk):
+        resampler.process(data[:, idx:idx + chunk])
+    return time.process_time() - start
+
+
+if __name__ == '__main__':
+    rng = np.random.default_rng(0)
+    for path, in_rate, out_rate in CASES:
+        data = rng.normal(size=(CHANNELS, in_rate * SECONDS))
+        for duration in CHUNK_DURATIONS:
+            chunk = int(in_rate * duration)
+            results = {
+                'fft': bench_fft(data, chunk, out_rate, in_rate),
+                'polyphase': bench_stateful(PolyphaseResampler(in_rate, out_rate), data, chunk),
+                'block_avg': bench_stateful(BlockAverageDecimator(in_rate, out_rate), data, chunk),
+            }
+            summary = ' | '.join(f'{name} : {cpu / SECONDS * 1000:7.3f} ms' for name, cpu in results.items())
+            print(f'{path:24} {in_rate:>5} -> {out_rate:<5} chunk {duration * 1000:6.1f} ms | {summary}')
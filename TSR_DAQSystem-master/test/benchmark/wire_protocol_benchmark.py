@@ -0,0 +1,81 @@
+"""
+    DAQ → 서버 전송 형식 비교 (메시지당 바이트 수, 인코딩/디코딩 시간)
+    - legacy : pickle((event, {sensor: {'type', 'data': [float]}})) + b'\\o'
+    - binary : wire_protocol 프레임 (float32 LE 샘플)
+
+    DAQ 쪽(numpy) 인코더로 만든 프레임을 서버 쪽(array) read_message 로 읽어 상호 호환도 확인한다.
+    실행: python test/benchmark/wire_protocol_benchmark.py (TSR_DAQSystem-master 기준)
+"""
+import os
+import io
+import time
+import pickle
+import asyncio
+import importlib.util
+import numpy as np
+
+ROOT = os.path.join(os.path.dirname(__file__), '..', '..', '..')
+SENSORS = 8
+REPEAT = 200
+CASES = (('30 S/s (sent)', 30), ('25.6 kS/s (raw)', 25600))
+
+
+def load(name: str, path: str):
+    # 패키지 __init__ 의 GUI/웹 의존성을 피하기 위해 모듈 파일만 로드
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+client = load('client_wire', os.path.join(ROOT, 'TSR_DAQSystem-master', 'src', 'background', 'machine_client', 'wire_protocol.py'))
+server = load('server_wire', os.path.join(ROOT, 'TSR_MonitoringServer-master', 'src', 'monitoring_app', 'machine_server', 'wire_protocol.py'))
+
+
+def legacy_encode(data):
+    legacy = {sensor: {'type': s_data['type'], 'data': s_data['data'].tolist()} for sensor, s_data in data.items()}
+    with io.BytesIO() as memfile:
+        pickle.dump(('DataUpdate', legacy), memfile)
+        return memfile.getvalue() + server.SEP
+
+
+def per_call(func) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        func()
+    return (time.perf_counter() - start) / REPEAT * 1e6
+
+
+async def read_all(frames: bytes, count: int):
+    # 기존 형식의 큰 메시지도 읽을 수 있도록 readuntil 한도 확장
+    reader = asyncio.StreamReader(limit=2 ** 24)
+    reader.feed_data(frames)
+    reader.feed_eof()
+    return [await server.read_message(reader) for _ in range(count)]
+
+
+if __name__ == '__main__':
+    rng = np.random.default_rng(0)
+    for name, rate in CASES:
+        data = {f'sensor_{idx}': {'type': 'VIB', 'rate': rate, 'data': rng.normal(0, 1, rate)} for idx in range(SENSORS)}
+        legacy = legacy_encode(data)
+        binary = client.encode('DataUpdate', 1, data)
+        payload = binary[client.HEADER.size:]
+
+        print(f'[{name}] {SENSORS} sensors x {rate} samples')
+        print(f'  legacy : {len(legacy):9} bytes | encode : {per_call(lambda: legacy_encode(data)):9.1f} us | '
+              f'decode : {per_call(lambda: server.legacy_deserialize(legacy)):9.1f} us | '
+              f'SEP inside payload : {legacy[:-server.SEP_LEN].count(server.SEP)}')
+        print(f'  binary : {len(binary):9} bytes | encode : {per_call(lambda: client.encode("DataUpdate", 1, data)):9.1f} us | '
+              f'decode : {per_call(lambda: server.decode_payload(server.EVENT_DATA_UPDATE, payload)):9.1f} us (server) / '
+              f'{per_call(lambda: client.decode_payload(client.EVENT_DATA_UPDATE, payload)):7.1f} us (numpy)')
+
+        # 기존 pickle 과 바이너리 프레임이 섞인 스트림을 서버 리더로 복원
+        # (데이터 안에 SEP 가 나타난 기존 메시지는 잘려서 복원되지 않으므로 작은 메시지로 대체)
+        if legacy[:-server.SEP_LEN].count(server.SEP):
+            legacy = legacy_encode({'sensor_0': {'type': 'VIB', 'rate': 1, 'data': np.zeros(1)}})
+        fault = client.encode('FaultDetect', 1, {'score': 12, 'threshold': 10})
+        messages = asyncio.run(read_all(legacy + binary + fault, 3))
+        restored = messages[1][1]
+        exact = all(np.array_equal(np.asarray(restored[s]['data']), data[s]['data'].astype(np.float32)) for s in data)
+        print(f'  interop : events={[m[0] for m in messages]} | float32 exact : {exact} | fault : {messages[2][1]}')
@@ -12,6 +12,8 @@ class ServerConfig:
     HOST            : str = cfg['SERVER']['HOST']
     PORT            : int = cfg['SERVER']['PORT']
     TCP_PORT        : int = cfg['SERVER']['TCP_PORT']
+    # TCP 수신 워커 프로세스 수 (1 이면 기존 단일 프로세스)
+    TCP_WORKERS     : int = cfg['SERVER'].get('TCP_WORKERS', 1)
     CORS_ORIGINS    : List[str] = cfg['SERVER']['CORS_ORIGINS']
     SIO_PREFIX      : str = '/sio'
 
@@ -48,12 +48,20 @@ class DataHandler:
         self.fcm_sender = FCMSender()
 
     def _init_writers(self):
-        # 날짜별 원시 CSV 저장 초기화
+        # 날짜별 원시 CSV 저장 초기화 (기존 작성기는 새 파일로 롤오버)
         os.makedirs(self.save_path, exist_ok=True)
         for sensor in self.stats.keys():
             header: List[str] = ['time', 'data']
             path = os.path.join(self.save_path, f'{get_date()}_{sensor}.csv')
-            self.writers[sensor] = CsvWriter(path, header)
+            if sensor in self.writers:
+                self.writers[sensor].rollover(path)
+            else:
+                self.writers[sensor] = CsvWriter(path, header)
+
+    def close(self):
+        # 연결 종료 시 버퍼에 남은 데이터 기록
+        for writer in self.writers.values():
+            writer.close()
 
     async def data_processing(self, machine_event, data: Dict):
         # 이벤트 타입에 따라 처리 분기
@@ -94,8 +102,7 @@ class DataHandler:
             self.stats[s_name].add(s_data['data'])
             self.min_stats[s_name].add(s_data['data'])
 
-            datas = [[cur_time, data] for data in s_data['data']]
-            self.writers[s_name].add_datas(datas)
+            self.writers[s_name].add_block(cur_time, s_data['data'])
 
     async def _anomaly_handle(self, data: Dict):
         # Socket.IO로 이상 이벤트 전달
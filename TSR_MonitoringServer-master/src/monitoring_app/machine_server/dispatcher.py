@@ -0,0 +1,101 @@
+import zlib
+import socket
+import asyncio
+import functools
+
+from typing import List, Tuple, Type
+from multiprocessing import connection
+
+from . import wire_protocol
+from .machine_thread import MachineThread, set_machine_ids
+
+# 최초 name 메시지를 기다리는 시간 (초) 과 최대 크기 (bytes)
+HANDSHAKE_TIMEOUT: float = 10.0
+HANDSHAKE_LIMIT: int = 64 * 2 ** 10
+
+
+def shard(machine_name: str, workers: int) -> int:
+    # 같은 머신은 재접속해도 항상 같은 워커로 (CSV/DB 작성기 중복 방지)
+    return zlib.crc32(machine_name.encode('utf-8')) % workers
+
+
+async def _handshake(loop: asyncio.AbstractEventLoop, sock: socket.socket) -> Tuple[str, bytes]:
+    # name 메시지를 구분자까지 읽어 머신 이름과 지금까지 받은 bytes 반환
+    received = b''
+    while wire_protocol.SEP not in received:
+        if len(received) > HANDSHAKE_LIMIT:
+            raise RuntimeError('handshake too long')
+        chunk = await loop.sock_recv(sock, 4096)
+        if not chunk:
+            raise ConnectionError('closed before handshake')
+        received += chunk
+
+    end = received.index(wire_protocol.SEP) + wire_protocol.SEP_LEN
+    event, machine_name = wire_protocol.legacy_deserialize(received[:end])
+    if event != 'name':
+        raise RuntimeError(f'unexpected handshake event {event}')
+    return machine_name, received
+
+
+async def _dispatch(loop: asyncio.AbstractEventLoop,
+                    sock: socket.socket,
+                    handoff_conns: List[connection.Connection]):
+    try:
+        machine_name, received = await asyncio.wait_for(_handshake(loop, sock), HANDSHAKE_TIMEOUT)
+        # 소켓과 이미 읽은 bytes 를 담당 워커로 넘김 (워커가 name 메시지부터 다시 처리)
+        handoff_conns[shard(machine_name, len(handoff_conns))].send((sock, received))
+    except Exception as err:
+        print(f'Dispatch Error : \n{str(err)}')
+    finally:
+        sock.close()
+
+
+async def _serve(host: str, port: int, handoff_conns: List[connection.Connection]):
+    loop = asyncio.get_event_loop()
+    listener = socket.create_server((host, port))
+    listener.setblocking(False)
+
+    while True:
+        sock, _ = await loop.sock_accept(listener)
+        loop.create_task(_dispatch(loop, sock, handoff_conns))
+
+
+def run_dispatcher(host: str, port: int, handoff_conns: List[connection.Connection]):
+    # 연결을 받아 머신 이름만 확인한 뒤 워커 프로세스로 소켓 전달
+    try:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(_serve(host, port, handoff_conns))
+    except KeyboardInterrupt:
+        for handoff_conn in handoff_conns:
+            handoff_conn.close()
+
+
+async def _receive_connections(handoff_conn: connection.Connection,
+                               w_conn: connection.Connection,
+                               protocol: Type[MachineThread]):
+    loop = asyncio.get_event_loop()
+    while True:
+        try:
+            sock, received = await loop.run_in_executor(None, handoff_conn.recv)
+        except EOFError:
+            break
+
+        sock.setblocking(False)
+        await loop.connect_accepted_socket(functools.partial(protocol, w_conn, initial_data=received), sock)
+
+
+def run_worker(index: int,
+               workers: int,
+               handoff_conn: connection.Connection,
+               w_conn: connection.Connection,
+               protocol: Type[MachineThread] = MachineThread):
+    # 전달받은 연결의 수신/통계/저장을 담당, 이벤트는 워커별 파이프로 메인 프로세스에 전달
+    try:
+        # 워커 간 machine id 가 겹치지 않도록 번호 간격을 워커 수로 둠
+        set_machine_ids(start=index + 1, step=workers)
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(_receive_connections(handoff_conn, w_conn, protocol))
+    except KeyboardInterrupt:
+        w_conn.close()
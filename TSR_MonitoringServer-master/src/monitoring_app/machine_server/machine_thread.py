@@ -1,29 +1,67 @@
-import io
-import pickle
+import time
 import asyncio
 import socket
+import itertools
 
+from dataclasses import dataclass, asdict
 from asyncio import transports, Protocol
 from multiprocessing import connection
 
 from .pipe_serialize import pipe_serialize, MachineThreadEvent
 from .data_handler import DataHandler
+from . import wire_protocol
 
-SEP: bytes = b'\o'
-SEP_LEN: int = len(SEP)
+# 바이너리 프로토콜을 수락한 연결에 부여하는 번호
+_machine_ids = itertools.count(1)
+
+# 수신 버퍼가 HIGH_WATER 를 넘으면 읽기를 멈추고 LOW_WATER 아래로 내려가면 재개 (bytes)
+HIGH_WATER: int = 4 * 2 ** 20
+LOW_WATER: int = 1 * 2 ** 20
+# 기존 pickle 메시지 한 개의 최대 크기 (StreamReader.readuntil 한도)
+READ_LIMIT: int = 16 * 2 ** 20
+STATS_INTERVAL: float = 1.0
+
+
+def set_machine_ids(start: int = 1, step: int = 1):
+    global _machine_ids
+    _machine_ids = itertools.count(start, step)
+
+
+@dataclass
+class ConnectionStats:
+    messages            : int = 0
+    bytes               : int = 0
+    messages_per_sec    : float = 0.0
+    bytes_per_sec       : float = 0.0
+    queue_depth         : int = 0      # 수신했지만 아직 처리하지 않은 bytes
+    max_queue_depth     : int = 0
+    pauses              : int = 0      # 처리 지연으로 읽기를 멈춘 횟수
 
 
 class MachineThread(Protocol):
-    def __init__(self, w_conn: connection.Connection):
+    def __init__(self, w_conn: connection.Connection, initial_data: bytes = b''):
         self.w_conn = w_conn
+        # 디스패처가 머신 이름 확인을 위해 먼저 읽은 bytes
+        self.initial_data = initial_data
 
         self.data_handler = None
         self.machine_name = None
+        self.machine_id = None
         self.peer_name = None
         self.transport = None
         self.writer = None
         self.reader = None
 
+        # 연결당 하나의 소비 태스크가 순서대로 메시지를 처리
+        self.consumer: asyncio.Task = None
+        self.stats = ConnectionStats()
+        self._received: int = 0
+        self._consumed: int = 0
+        self._paused: bool = False
+        self._window_start: float = time.monotonic()
+        self._window_messages: int = 0
+        self._window_bytes: int = 0
+
     def connection_made(self, transport: transports.WriteTransport) -> None:
         self.transport = transport
         # TCP KeepAlive 설정
@@ -32,51 +70,96 @@ class MachineThread(Protocol):
         sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60)
         sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 60)
         sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
-        self.reader = asyncio.StreamReader(loop=asyncio.get_event_loop())
+        self.reader = asyncio.StreamReader(limit=READ_LIMIT, loop=asyncio.get_event_loop())
         self.writer = asyncio.StreamWriter(transport=transport,
                                            protocol=self,
                                            reader=self.reader,
                                            loop=asyncio.get_event_loop())
 
         self.peer_name = transport.get_extra_info('peer_name')
-        asyncio.create_task(self.set_machine_name())
+        self.consumer = asyncio.create_task(self.handle_messages())
+        if self.initial_data:
+            self.data_received(self.initial_data)
 
     async def set_machine_name(self):
-        # 최초 메시지에서 머신 이름 수신
-        msg = await self.reader.readuntil(SEP)
-        machine_event, data = self.deserialize(msg)
+        # 최초 메시지(기존 pickle)에서 머신 이름 수신
+        machine_event, data, size = await wire_protocol.read_message(self.reader)
+        self._message_consumed(size)
         self.machine_name = data
         self.w_conn.send(pipe_serialize(event=MachineThreadEvent.CONNECT, machine_name=self.machine_name))
         self.data_handler = DataHandler(self.machine_name, self.w_conn)
 
     async def handle_messages(self):
-        # 클라이언트 데이터 수신 루프
-        while True:
-            try:
-                msg = await self.reader.readuntil(SEP)
-                machine_event, data = self.deserialize(msg)
-                await self.data_handler.data_processing(machine_event, data)
-            except asyncio.IncompleteReadError:
-                break
-            except RuntimeError:
-                break
+        # 클라이언트 데이터 수신 루프 (연결 종료 시 EOF 로 빠져나옴)
+        try:
+            await self.set_machine_name()
+            while True:
+                machine_event, data, size = await wire_protocol.read_message(self.reader)
+                try:
+                    if machine_event == 'protocol':
+                        self.accept_protocol(data)
+                    else:
+                        await self.data_handler.data_processing(machine_event, data)
+                except Exception as err:
+                    # 메시지 하나의 처리 오류로 수신 루프가 멈추지 않도록 함
+                    print(f'{self.machine_name} Data Processing Error : \n{str(err)}')
+                self._message_consumed(size)
+        except asyncio.IncompleteReadError:
+            pass
+        except RuntimeError:
+            # 프레임이 깨지면 이후 경계를 신뢰할 수 없으므로 연결 종료
+            self.transport.close()
+        finally:
+            # 남은 메시지까지 처리한 뒤 메인 프로세스에 연결 해제와 연결 통계 전달
+            if self.data_handler is not None:
+                self.data_handler.close()
+            self.stats.messages += self._window_messages
+            self.stats.bytes += self._window_bytes
+            self._window_messages, self._window_bytes = 0, 0
+            self.w_conn.send(pipe_serialize(event=MachineThreadEvent.DISCONNECT,
+                                            machine_name=self.machine_name,
+                                            data=asdict(self.stats)))
 
     def data_received(self, data):
         self.reader.feed_data(data)
-        asyncio.create_task(self.handle_messages())
+        self._received += len(data)
+
+        # 처리가 밀려 버퍼가 쌓이면 소켓 읽기 중단 (TCP 흐름 제어로 DAQ 송신이 느려짐)
+        depth = self._received - self._consumed
+        self.stats.max_queue_depth = max(self.stats.max_queue_depth, depth)
+        if not self._paused and depth > HIGH_WATER:
+            self._paused = True
+            self.stats.pauses += 1
+            self.transport.pause_reading()
+
+    def _message_consumed(self, size: int) -> None:
+        self._consumed += size
+        self._window_messages += 1
+        self._window_bytes += size
+
+        if self._paused and self._received - self._consumed < LOW_WATER:
+            self._paused = False
+            self.transport.resume_reading()
+        self._update_stats()
+
+    def _update_stats(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        self.stats.queue_depth = self._received - self._consumed
+        if elapsed >= STATS_INTERVAL:
+            self.stats.messages += self._window_messages
+            self.stats.bytes += self._window_bytes
+            self.stats.messages_per_sec = self._window_messages / elapsed
+            self.stats.bytes_per_sec = self._window_bytes / elapsed
+            self._window_start, self._window_messages, self._window_bytes = now, 0, 0
 
     def connection_lost(self, exc) -> None:
-        # 연결 해제 시 메인 프로세스에 알림
-        self.w_conn.send(pipe_serialize(event=MachineThreadEvent.DISCONNECT, machine_name=self.machine_name))
+        # 소비 태스크에 EOF 를 알려 버퍼에 남은 메시지 처리 후 종료하게 함
+        self.reader.feed_eof()
         self.writer.close()
 
-    def deserialize(self, serialized: bytes):
-        try:
-            # SEP 제거 후 pickle 역직렬화
-            with io.BytesIO() as memfile:
-                memfile.write(serialized[:-SEP_LEN])
-                memfile.seek(0)
-                event, data = pickle.load(memfile)
-        except Exception:
-            raise RuntimeError('deserialize error')
-        return event, data
+    def accept_protocol(self, version: int):
+        # 지원하는 버전이면 번호를 부여해 응답, 이후 DAQ 는 바이너리 프레임 전송
+        if version == wire_protocol.VERSION:
+            self.machine_id = next(_machine_ids) & 0xFFFF
+            self.writer.write(wire_protocol.encode_ack(self.machine_id))
@@ -1,12 +1,13 @@
 import abc
 import asyncio
 
-from typing import Tuple
+from typing import List, Type
 from multiprocessing import Process, Pipe
 
 from monitoring_app.machine_server.pipe_serialize import pipe_deserialize, MachineThreadEvent
 from .data_handler import MachineEvent
 from .machine_thread import MachineThread
+from .dispatcher import run_dispatcher, run_worker
 
 
 class EventHandler(abc.ABC):
@@ -23,21 +24,29 @@ class Runner:
     def __init__(self,
                  host: str,
                  port: int,
-                 event_handler: EventHandler):
+                 event_handler: EventHandler,
+                 workers: int = 1,
+                 protocol: Type[MachineThread] = MachineThread):
         self.host = host
         self.port = port
         self.event_handler = event_handler
-        self.r_conn, self.w_conn = Pipe(duplex=False)
+        self.workers = max(1, workers)
+        self.protocol = protocol
+        # 워커마다 별도 이벤트 파이프 (여러 프로세스가 한 파이프에 쓰면 메시지가 섞일 수 있음)
+        self.pipes = [Pipe(duplex=False) for _ in range(self.workers)]
+        self.r_conn, self.w_conn = self.pipes[0]
 
         self.machine_server_process = None
+        self.processes: List[Process] = []
 
     def _run_machine_server(self):
         try:
-            loop = asyncio.get_event_loop()
-            # TCP 서버를 별도 프로세스에서 실행
+            # 부모의 이벤트 루프를 물려받지 않도록 새 루프에서 TCP 서버 실행
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
             server = loop.run_until_complete(
                 loop.create_server(
-                    protocol_factory=lambda: MachineThread(self.w_conn),
+                    protocol_factory=lambda: self.protocol(self.w_conn),
                     host=self.host,
                     port=self.port
                 )
@@ -46,26 +55,51 @@ class Runner:
         except KeyboardInterrupt:
             self.w_conn.close()
 
-    async def pipe_rcv_event(self):
+    async def pipe_rcv_event(self, r_conn=None):
         loop = asyncio.get_event_loop()
+        r_conn = self.r_conn if r_conn is None else r_conn
         # 별도 프로세스에서 전달된 이벤트를 메인 루프로 전달
         while True:
-            pipe_msg: bytes = await loop.run_in_executor(None, self.r_conn.recv)
+            try:
+                pipe_msg: bytes = await loop.run_in_executor(None, r_conn.recv)
+            except (EOFError, OSError):
+                break
             if pipe_msg is None:
                 break
 
             machine_thread_event, machine_name, machine_event, data = pipe_deserialize(pipe_msg)
             await self.event_handler(machine_thread_event, machine_name, machine_event, data)
 
+    def _start_workers(self):
+        # 디스패처 1개 + 워커 N개, 연결은 머신 이름으로 워커에 고정 배정
+        handoff_pipes = [Pipe(duplex=False) for _ in range(self.workers)]
+        for index, ((handoff_r, _), (_, w_conn)) in enumerate(zip(handoff_pipes, self.pipes)):
+            self.processes.append(Process(target=run_worker,
+                                          args=(index, self.workers, handoff_r, w_conn, self.protocol),
+                                          daemon=True))
+        self.processes.append(Process(target=run_dispatcher,
+                                      args=(self.host, self.port, [handoff_w for _, handoff_w in handoff_pipes]),
+                                      daemon=True))
+        for process in self.processes:
+            process.start()
+
     def run(self):
         loop = asyncio.get_event_loop()
-        loop.create_task(self.pipe_rcv_event())
+        for r_conn, _ in self.pipes:
+            loop.create_task(self.pipe_rcv_event(r_conn))
+
+        if self.workers > 1:
+            self._start_workers()
+            return
 
         # TCP 서버 프로세스 실행
         self.machine_server_process = Process(target=self._run_machine_server, daemon=True)
         self.machine_server_process.start()
+        self.processes.append(self.machine_server_process)
 
     def stop(self):
         # 프로세스 종료 및 파이프 정리
-        self.r_conn.close()
-        self.machine_server_process.join()
+        for r_conn, _ in self.pipes:
+            r_conn.close()
+        for process in self.processes:
+            process.join()
@@ -0,0 +1,111 @@
+"""
+    DAQ → 모니터링 서버 바이너리 프레임 프로토콜 (버전 1, DAQSystem 의 wire_protocol 과 동일 규격)
+
+    프레임 : [헤더 12 bytes][페이로드]
+      헤더 '<4sBBHI' : magic(b'TSRW') version event_id machine_id payload_len
+    DataUpdate 페이로드 : sensor_count(H) + 센서마다
+      '<BBII' name_len type_id rate count + 이름(UTF-8) + float32 LE 샘플 count 개
+    FaultDetect 페이로드 : '<dd' score threshold
+    ProtocolAck (서버 → DAQ) : 페이로드 없음, 헤더의 machine_id 가 서버가 부여한 번호
+
+    기존 pickle 메시지는 pickle PROTO 바이트(0x80)로 시작하므로 프레임마다 magic 으로 형식을 구분한다.
+"""
+import io
+import sys
+import pickle
+import struct
+import asyncio
+from array import array
+from typing import Dict, Tuple
+
+MAGIC: bytes = b'TSRW'
+VERSION: int = 1
+
+SEP: bytes = b'\o'
+SEP_LEN: int = len(SEP)
+
+HEADER = struct.Struct('<4sBBHI')
+SENSOR_COUNT = struct.Struct('<H')
+SENSOR_HEADER = struct.Struct('<BBII')
+FAULT_DETECT = struct.Struct('<dd')
+
+EVENT_DATA_UPDATE: int = 1
+EVENT_FAULT_DETECT: int = 2
+EVENT_PROTOCOL_ACK: int = 3
+
+EVENT_NAMES: Dict[int, str] = {EVENT_DATA_UPDATE: 'DataUpdate', EVENT_FAULT_DETECT: 'FaultDetect'}
+
+SENSOR_TYPES: Tuple[str, ...] = ('VIB', 'TEMP')
+
+
+def encode_ack(machine_id: int) -> bytes:
+    return HEADER.pack(MAGIC, VERSION, EVENT_PROTOCOL_ACK, machine_id, 0)
+
+
+def decode_header(header: bytes) -> Tuple[int, int, int]:
+    magic, version, event_id, machine_id, payload_len = HEADER.unpack(header)
+    if magic != MAGIC or version != VERSION:
+        raise RuntimeError('invalid frame header')
+    return event_id, machine_id, payload_len
+
+
+def _samples(payload: bytes, offset: int, count: int) -> array:
+    samples = array('f')
+    samples.frombytes(payload[offset:offset + count * samples.itemsize])
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    return samples
+
+
+def _number(value: float):
+    # 정수로 보낸 점수/임계값은 정수로 복원
+    return int(value) if value.is_integer() else value
+
+
+def decode_payload(event_id: int, payload: bytes) -> Tuple[str, any]:
+    # 기존 pickle 메시지와 같은 (event, data) 형태로 복원, 샘플은 array('f')
+    if event_id == EVENT_DATA_UPDATE:
+        data = {}
+        (count,) = SENSOR_COUNT.unpack_from(payload, 0)
+        offset = SENSOR_COUNT.size
+        for _ in range(count):
+            name_len, type_id, rate, samples = SENSOR_HEADER.unpack_from(payload, offset)
+            offset += SENSOR_HEADER.size
+            name = payload[offset:offset + name_len].decode('utf-8')
+            offset += name_len
+            data[name] = {
+                'type': SENSOR_TYPES[type_id - 1],
+                'rate': rate,
+                'data': _samples(payload, offset, samples)
+            }
+            offset += samples * 4
+        return EVENT_NAMES[event_id], data
+    if event_id == EVENT_FAULT_DETECT:
+        score, threshold = FAULT_DETECT.unpack(payload)
+        return EVENT_NAMES[event_id], {'score': _number(score), 'threshold': _number(threshold)}
+    raise RuntimeError('unsupported wire event')
+
+
+def legacy_deserialize(serialized: bytes):
+    try:
+        # SEP 제거 후 pickle 역직렬화
+        with io.BytesIO() as memfile:
+            memfile.write(serialized[:-SEP_LEN])
+            memfile.seek(0)
+            event, data = pickle.load(memfile)
+    except Exception:
+        raise RuntimeError('deserialize error')
+    return event, data
+
+
+async def read_message(reader: asyncio.StreamReader) -> Tuple[str, any, int]:
+    # 프레임 앞 4 bytes 로 바이너리/기존 pickle 형식을 판별해 (event, data, 프레임 크기) 반환
+    head = await reader.readexactly(len(MAGIC))
+    if head != MAGIC:
+        serialized = head + await reader.readuntil(SEP)
+        return (*legacy_deserialize(serialized), len(serialized))
+
+    header = head + await reader.readexactly(HEADER.size - len(MAGIC))
+    event_id, machine_id, payload_len = decode_header(header)
+    payload = await reader.readexactly(payload_len)
+    return (*decode_payload(event_id, payload), HEADER.size + payload_len)
@@ -48,7 +48,7 @@ class MachineHandler(EventHandler):
             elif event == MachineThreadEvent.DISCONNECT:
                 # 머신 연결 해제 시 네임스페이스 제거
                 del self.sio.namespace_handlers[namespace]
-                self.machine_logger.info(f'{machine_name} disconnected')
+                self.machine_logger.info(f'{machine_name} disconnected | {data}')
 
 
 class MonitoringApp:
@@ -73,7 +73,8 @@ class MonitoringApp:
         # DAQ TCP 수신 서버 프로세스
         self.machine_server_runner = Runner(host=self.host,
                                             port=ServerConfig.TCP_PORT,
-                                            event_handler=MachineHandler(self.sio, self.machine_logger, self.sio_logger))
+                                            event_handler=MachineHandler(self.sio, self.machine_logger, self.sio_logger),
+                                            workers=ServerConfig.TCP_WORKERS)
 
     def _server_load(self) -> Server:
         uvicorn_log_config = uvicorn.config.LOGGING_CONFIG
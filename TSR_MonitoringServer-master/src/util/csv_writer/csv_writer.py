@@ -1,27 +1,87 @@
 import os
 import csv
-from typing import List
+import time
+from typing import List, TextIO
+
+# 기존 csv.writer 출력과 같은 줄 끝 문자
+LINE_TERMINATOR: str = '\r\n'
 
 
 class CsvWriter:
-    def __init__(self, path: str, header: List[str]):
-        self._path = path
+    """
+        파일 핸들을 열어 둔 채 큰 버퍼로 기록하는 CSV 작성기
+        flush_interval(초) 마다 디스크로 내보내며, rollover 로 새 파일을 먼저 연 뒤 기존 파일을 닫는다.
+    """
+    def __init__(self,
+                 path: str,
+                 header: List[str],
+                 buffer_size: int = 1 << 20,
+                 flush_interval: float = 1.0):
         self._header = header
-        self._file_init()
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
 
-    def _file_init(self):
-        if not os.path.isfile(self._path):
-            with open(self._path, "w", newline='\n') as file:
-                writer = csv.writer(file)
-                writer.writerow(self._header)
+        self._path: str = None
+        self._file: TextIO = None
+        self._last_flush: float = time.monotonic()
+        self.rows: int = 0
+        self.rollover(path)
 
-    def add_datas(self, datas: List[List]):
+    def path(self) -> str:
+        return self._path
+
+    def _open(self, path: str) -> TextIO:
+        # 새 파일일 때만 헤더 기록
+        is_new = not os.path.isfile(path) or os.path.getsize(path) == 0
+        file = open(path, 'a', newline='\n', buffering=self._buffer_size)
+        if is_new:
+            csv.writer(file).writerow(self._header)
+        return file
+
+    def rollover(self, path: str) -> None:
+        # 날짜 변경 등으로 경로가 바뀌면 새 파일을 연 다음 교체하고 기존 파일을 닫음
+        if path == self._path and self._file is not None:
+            return
         try:
-            self._file_init()
+            file = self._open(path)
+        except Exception as err:
+            print('CSV Open Error : \n', err)
+            return
+
+        prev_file, self._file, self._path = self._file, file, path
+        if prev_file is not None:
+            prev_file.close()
 
-            with open(self._path, "a", newline='\n') as file:
-                writer = csv.writer(file)
-                writer.writerows(datas)
+    def add_datas(self, datas: List[List]):
+        try:
+            csv.writer(self._file).writerows(datas)
+            self.rows += len(datas)
+            self._flush_if_due()
+        except Exception as err:
+            print('CSV Write Error : \n', err)
 
+    def add_block(self, time_str: str, datas) -> None:
+        # 같은 시각의 샘플 묶음을 한 번에 포맷해 기록 (numpy 배열 또는 리스트)
+        try:
+            values = datas.tolist() if hasattr(datas, 'tolist') else datas
+            self._file.write((f'{time_str},%r{LINE_TERMINATOR}' * len(values)) % tuple(values))
+            self.rows += len(values)
+            self._flush_if_due()
         except Exception as err:
             print('CSV Write Error : \n', err)
+
+    def _flush_if_due(self) -> None:
+        now = time.monotonic()
+        if now - self._last_flush >= self._flush_interval:
+            self._file.flush()
+            self._last_flush = now
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+            self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
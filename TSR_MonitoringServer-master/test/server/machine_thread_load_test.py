@@ -0,0 +1,93 @@
+"""
+    MachineThread 수신 부하 테스트
+    DAQ 대신 빠르게 메시지를 보내는 클라이언트와 느린 처리 핸들러를 붙여
+    연결당 태스크 수, 처리 순서, 읽기 중단(backpressure) 횟수, 수신 통계를 출력한다.
+
+    실행: python test/server/machine_thread_load_test.py (TSR_MonitoringServer-master 기준, resources/config.yml 필요)
+"""
+import io
+import os
+import sys
+import time
+import pickle
+import asyncio
+from multiprocessing import Pipe
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from monitoring_app.machine_server.machine_thread import MachineThread
+from monitoring_app.machine_server import wire_protocol
+
+MESSAGES = 2000
+SAMPLES = 2000
+HANDLE_TIME = 0.001
+
+
+class SlowHandler:
+    # 실제 DataHandler 대신 처리 시간만 흉내 내고 수신 순서를 기록
+    def __init__(self):
+        self.sequence = []
+        self.max_tasks = 0
+
+    async def data_processing(self, machine_event, data):
+        self.sequence.append(int(data['s0']['data'][0]))
+        self.max_tasks = max(self.max_tasks, len(asyncio.all_tasks()))
+        time.sleep(HANDLE_TIME)
+        await asyncio.sleep(0)
+
+    def close(self):
+        pass
+
+
+class LoadTestThread(MachineThread):
+    async def set_machine_name(self):
+        # 이름만 읽고 실제 DataHandler 대신 SlowHandler 연결
+        machine_event, data, size = await wire_protocol.read_message(self.reader)
+        self._message_consumed(size)
+        self.machine_name = data
+        self.data_handler = handler
+
+
+def legacy_frame(event, data) -> bytes:
+    with io.BytesIO() as memfile:
+        pickle.dump((event, data), memfile)
+        return memfile.getvalue() + wire_protocol.SEP
+
+
+async def client(port: int) -> None:
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(legacy_frame('name', 'load_test'))
+    for seq in range(MESSAGES):
+        writer.write(legacy_frame('DataUpdate', {'s0': {'type': 'VIB', 'data': [float(seq)] * SAMPLES}}))
+        await writer.drain()
+    writer.close()
+    await writer.wait_closed()
+
+
+async def main() -> None:
+    r_conn, w_conn = Pipe(duplex=False)
+    protocols = []
+
+    def factory():
+        protocol = LoadTestThread(w_conn)
+        protocols.append(protocol)
+        return protocol
+
+    server = await asyncio.get_running_loop().create_server(factory, '127.0.0.1', 0)
+    port = server.sockets[0].getsockname()[1]
+
+    start = time.perf_counter()
+    await client(port)
+    await protocols[0].consumer
+    elapsed = time.perf_counter() - start
+    server.close()
+
+    stats = protocols[0].stats
+    print(f'messages : {len(handler.sequence)}/{MESSAGES} in {elapsed:.2f} s | '
+          f'in order : {handler.sequence == list(range(MESSAGES))} | max tasks : {handler.max_tasks}')
+    print(f'stats : {stats}')
+
+
+if __name__ == '__main__':
+    handler = SlowHandler()
+    asyncio.run(main())
@@ -0,0 +1,175 @@
+"""
+    다중 워커 TCP 수신 부하 테스트
+    가짜 DAQ 여러 대가 바이너리 프레임을 동시에 보내는 동안 Runner 의 워커 수를 바꿔 가며
+    전체 처리량(messages/s, MB/s)과 워커별 연결 분배를 출력한다.
+    워커는 실제 DataHandler 대신 통계 누적(abs 합) + CSV 기록만 수행한다.
+
+    실행: python test/server/multi_worker_load_test.py [워커 수 ...] (TSR_MonitoringServer-master 기준, resources/config.yml 필요)
+    NOTE: 워커 수만큼 CPU 코어가 있어야 처리량이 선형으로 늘어남
+"""
+import os
+import sys
+import time
+import socket
+import pickle
+import shutil
+import asyncio
+import tempfile
+import multiprocessing
+from array import array
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from util.csv_writer import CsvWriter
+from monitoring_app.machine_server import Runner, EventHandler, MachineThreadEvent
+from monitoring_app.machine_server.machine_thread import MachineThread
+from monitoring_app.machine_server.dispatcher import shard
+from monitoring_app.machine_server.pipe_serialize import pipe_serialize
+from monitoring_app.machine_server import wire_protocol
+from monitoring_app.machine_server.wire_protocol import HEADER, SENSOR_COUNT, SENSOR_HEADER
+
+MACHINES = 16
+MESSAGES = 200
+SENSORS = 4
+SAMPLES = 2560
+DATA_PATH = os.path.join(tempfile.gettempdir(), 'tsr_multi_worker_load_test')
+
+
+class FleetHandler:
+    # DataHandler 의 센서별 통계 누적 + CSV 기록 부하만 재현
+    def __init__(self, machine_name: str):
+        self.save_path = os.path.join(DATA_PATH, machine_name)
+        os.makedirs(self.save_path, exist_ok=True)
+        self.sums = {}
+        self.writers = {}
+
+    async def data_processing(self, machine_event, data):
+        for s_name, s_data in data.items():
+            if s_name not in self.writers:
+                self.writers[s_name] = CsvWriter(os.path.join(self.save_path, f'{s_name}.csv'), ['time', 'data'])
+                self.sums[s_name] = 0.0
+            self.sums[s_name] += sum(map(abs, s_data['data']))
+            self.writers[s_name].add_block('00:00:00', s_data['data'])
+
+    def close(self):
+        for writer in self.writers.values():
+            writer.close()
+
+
+class FleetTestThread(MachineThread):
+    async def set_machine_name(self):
+        # 이름만 읽고 실제 DataHandler 대신 FleetHandler 연결
+        machine_event, data, size = await wire_protocol.read_message(self.reader)
+        self._message_consumed(size)
+        self.machine_name = data
+        # 워커별 분배 확인을 위해 이름에 워커 pid 를 붙여 알림
+        self.w_conn.send(pipe_serialize(event=MachineThreadEvent.CONNECT,
+                                        machine_name=f'{self.machine_name}@{os.getpid()}'))
+        self.data_handler = FleetHandler(self.machine_name)
+
+
+class FleetEventHandler(EventHandler):
+    def __init__(self):
+        self.workers = {}
+        self.messages = 0
+        self.disconnected = 0
+        self.done = asyncio.Event()
+
+    async def __call__(self, event, machine_name, machine_event, data):
+        if event == MachineThreadEvent.CONNECT:
+            name, pid = machine_name.split('@')
+            self.workers[name] = pid
+        elif event == MachineThreadEvent.DISCONNECT:
+            # name, protocol 요청 메시지 제외
+            self.messages += data['messages'] - 2
+            self.disconnected += 1
+            if self.disconnected == MACHINES:
+                self.done.set()
+
+
+def legacy_frame(event, data) -> bytes:
+    return pickle.dumps((event, data)) + wire_protocol.SEP
+
+
+def data_frame() -> bytes:
+    payload = SENSOR_COUNT.pack(SENSORS)
+    samples = array('f', [((i % 200) - 100) / 10 for i in range(SAMPLES)]).tobytes()
+    for sensor in range(SENSORS):
+        name = f'sensor{sensor}'.encode('utf-8')
+        payload += SENSOR_HEADER.pack(len(name), 1, SAMPLES, SAMPLES) + name + samples
+    return HEADER.pack(wire_protocol.MAGIC, wire_protocol.VERSION, wire_protocol.EVENT_DATA_UPDATE, 0, len(payload)) + payload
+
+
+async def daq_client(port: int, machine_name: str, frame: bytes):
+    # 실제 DAQ 처럼 name → protocol 요청 → ACK 수신 후 바이너리 프레임 전송
+    while True:
+        try:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            break
+        except ConnectionRefusedError:
+            await asyncio.sleep(0.1)
+    writer.write(legacy_frame('name', machine_name) + legacy_frame('protocol', wire_protocol.VERSION))
+    await reader.readexactly(HEADER.size)
+    for _ in range(MESSAGES):
+        writer.write(frame)
+        await writer.drain()
+    writer.close()
+    await writer.wait_closed()
+
+
+def run_fleet(port: int):
+    # 클라이언트 부하가 서버 측 측정에 섞이지 않도록 별도 프로세스에서 실행
+    async def fleet():
+        frame = data_frame()
+        await asyncio.gather(*[daq_client(port, f'machine{i}', frame) for i in range(MACHINES)])
+    asyncio.run(fleet())
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+async def measure(workers: int):
+    shutil.rmtree(DATA_PATH, ignore_errors=True)
+    port = free_port()
+    handler = FleetEventHandler()
+    runner = Runner(host='127.0.0.1', port=port, event_handler=handler, workers=workers, protocol=FleetTestThread)
+    runner.run()
+
+    start = time.perf_counter()
+    fleet = multiprocessing.Process(target=run_fleet, args=(port,), daemon=True)
+    fleet.start()
+    await handler.done.wait()
+    elapsed = time.perf_counter() - start
+    fleet.join()
+
+    for process in runner.processes:
+        process.terminate()
+    runner.stop()
+
+    frame_bytes = len(data_frame())
+    per_worker = {}
+    for name, pid in handler.workers.items():
+        per_worker.setdefault(pid, []).append(name)
+    print(f'workers : {workers} | messages : {handler.messages}/{MACHINES * MESSAGES} in {elapsed:.2f} s | '
+          f'{handler.messages / elapsed:,.0f} msg/s | {handler.messages * frame_bytes / elapsed / 2 ** 20:.1f} MiB/s | '
+          f'machines per worker : {sorted(len(names) for names in per_worker.values())}')
+    return handler.messages / elapsed
+
+
+async def main(worker_counts):
+    print(f'cpu : {os.cpu_count()} | machines : {MACHINES} | {SENSORS} sensors x {SAMPLES} samples x {MESSAGES} messages')
+    print(f'shard (4 workers) : {[shard(f"machine{i}", 4) for i in range(MACHINES)]}')
+    base = None
+    for workers in worker_counts:
+        rate = await measure(workers)
+        base = rate if base is None else base
+        print(f'  speedup : x{rate / base:.2f}')
+    shutil.rmtree(DATA_PATH, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    counts = [int(arg) for arg in sys.argv[1:]] or [1, 2, 4]
+    asyncio.run(main(counts))